@@ -39,6 +39,10 @@ class Settings(BaseSettings):
     # Albiware Login Credentials (for browser automation)
     albiware_email: str = ""
     albiware_password: str = ""
+    project_creator_workers: int = 4  # Concurrent browser workers (capped at 8)
+    project_creator_rate: float = 1.0  # Contacts started per second across all workers
+    albiware_cdp_endpoint: str = ""  # Shared Chromium (e.g. http://localhost:9222); empty = launch our own
+    debug_screenshots: bool = False  # Save a JPEG of the page when project creation fails
     
     # Railway Configuration
     railway_token: Optional[str] = None
@@ -2,9 +2,10 @@
 Database connection and session management.
 """
 
+from contextlib import contextmanager
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Generator, Iterator
 import logging
 
 from .models import Base
@@ -12,6 +13,25 @@ from .models import Base
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def no_expire_on_commit(session: Session) -> Iterator[Session]:
+    """
+    Keep ORM objects loaded across commits inside the block.
+    
+    For loops that commit once per row and keep reading the same objects,
+    so each commit doesn't force a SELECT to reload them.
+    
+    Args:
+        session: SQLAlchemy session
+    """
+    original = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        yield session
+    finally:
+        session.expire_on_commit = original
+
+
 class Database:
     """Database connection manager."""
     
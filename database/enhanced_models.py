@@ -2,7 +2,7 @@
 Enhanced Database Models for Contact Tracking and SMS Conversations
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -124,6 +124,15 @@ class Contact(Base):
     conversations = relationship("SMSConversation", back_populates="contact")
     messages = relationship("SMSMessage", back_populates="contact")
     
+    __table_args__ = (
+        # Pending-contact scan in AlbiwareProjectCreator.process_pending_projects;
+        # partial, so it only holds the handful of contacts still waiting
+        Index(
+            'ix_contacts_pending_creation', 'project_creation_needed', 'project_created',
+            postgresql_where=text('project_creation_needed IS TRUE AND project_created IS FALSE')
+        ),
+    )
+    
     def __repr__(self):
         return f"<Contact {self.full_name} ({self.albiware_contact_id})>"
 
@@ -2,7 +2,7 @@
 Database models for tracking notifications and task completion.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -36,6 +36,11 @@ class Task(Base):
     # Relationships
     notifications = relationship("Notification", back_populates="task", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        # Open-task scan in NotificationEngine.process_task_notifications
+        Index('ix_task_open', 'status', 'completed_at', 'due_date'),
+    )
+    
     def __repr__(self):
         return f"<Task(id={self.id}, name='{self.task_name}', status='{self.status}')>"
 
@@ -59,6 +64,11 @@ class Notification(Base):
     # Relationships
     task = relationship("Task", back_populates="notifications")
     
+    __table_args__ = (
+        # Per-task notification counts and first/last sent_at lookups
+        Index('ix_notif_task_sent', 'task_id', 'sent_at'),
+    )
+    
     def __repr__(self):
         return f"<Notification(id={self.id}, task_id={self.task_id}, status='{self.delivery_status}')>"
 
@@ -11,6 +11,8 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
 import logging
+import logging.handlers
+import queue
 import sys
 
 from config.settings import settings
@@ -22,15 +24,20 @@ from services.sms_service import SMSService
 from services.notification_engine import NotificationEngine
 from services.contact_monitor import ContactMonitor
 from services.conversation_handler import ConversationHandler
-from services.project_creator import AlbiwareProjectCreator
+from services.project_creator import AlbiwareProjectCreator, ProjectCreatorPool
 from services.retry_persistence_scheduler import RetryPersistenceScheduler
 
-# Configure logging
+# Configure logging. Records go through a queue so browser workers and
+# request threads never block on stdout; the listener thread does the writing.
+log_stream_handler = logging.StreamHandler(sys.stdout)
+log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, log_stream_handler)
+log_listener.start()
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(sys.stdout)
+        logging.handlers.QueueHandler(log_queue)
     ]
 )
 
@@ -55,7 +62,8 @@ notification_engine = NotificationEngine(
     albiware_client,
     sms_service,
     settings.reminder_hours_before_due,
-    settings.max_reminders_per_task
+    settings.max_reminders_per_task,
+    session_factory=database.SessionLocal
 )
 
 # Initialize contact monitoring services
@@ -63,10 +71,19 @@ contact_monitor = ContactMonitor(albiware_client, sms_service)
 conversation_handler = ConversationHandler(sms_service)
 retry_persistence_scheduler = RetryPersistenceScheduler(sms_service)
 
-# Initialize project creator (with Albiware credentials)
-project_creator = AlbiwareProjectCreator(
-    albiware_email=settings.albiware_email,
-    albiware_password=settings.albiware_password
+# Initialize project creator pool (with Albiware credentials)
+# One warm creator shared by every caller caps Chromium at project_creator_workers
+# and keeps overlapping runs from picking up the same pending contacts
+project_creator_pool = ProjectCreatorPool(
+    lambda: AlbiwareProjectCreator(
+        albiware_email=settings.albiware_email,
+        albiware_password=settings.albiware_password,
+        max_workers=settings.project_creator_workers,
+        cdp_endpoint=settings.albiware_cdp_endpoint or None,
+        debug_screenshots=settings.debug_screenshots,
+        rate_limit=settings.project_creator_rate
+    ),
+    max_size=1
 )
 
 # Initialize scheduler
@@ -83,6 +100,15 @@ def get_db():
         db.close()
 
 
+def get_staff_phones():
+    """Staff phone numbers from settings."""
+    return [
+        phone.strip() 
+        for phone in settings.staff_phone_numbers.split(',') 
+        if phone.strip()
+    ]
+
+
 def scheduled_task_sync():
     """Scheduled task to sync tasks from Albiware and send notifications."""
     logger.info("Starting scheduled task sync...")
@@ -96,11 +122,7 @@ def scheduled_task_sync():
         logger.info(f"Synced {tasks_synced} tasks")
         
         # Process task notifications
-        staff_phones = [
-            phone.strip() 
-            for phone in settings.staff_phone_numbers.split(',') 
-            if phone.strip()
-        ]
+        staff_phones = get_staff_phones()
         
         if staff_phones:
             notifications_sent = notification_engine.process_task_notifications(db, staff_phones)
@@ -148,7 +170,8 @@ def scheduled_project_creation():
     db = next(db_gen)
     
     try:
-        projects_created = project_creator.process_pending_projects(db)
+        with project_creator_pool.acquire() as project_creator:
+            projects_created = project_creator.process_pending_projects(db)
         logger.info(f"Created {projects_created} projects")
         
     except Exception as e:
@@ -249,8 +272,11 @@ async def startup_event():
     scheduler.start()
     logger.info("Scheduler started with all jobs")
     
-    # Run initial syncs
-    scheduled_task_sync()
+    # Run initial syncs (task sync is queued on the engine's executor so startup isn't blocked)
+    notification_engine.sync_tasks_from_albiware_async()
+    staff_phones = get_staff_phones()
+    if staff_phones:
+        notification_engine.process_task_notifications_async(staff_phones)
     scheduled_contact_sync()
 
 
@@ -259,6 +285,8 @@ async def shutdown_event():
     """Shutdown scheduler on application shutdown."""
     logger.info("Shutting down Enhanced Albiware Agent...")
     scheduler.shutdown()
+    project_creator_pool.close()
+    log_listener.stop()
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -597,26 +625,23 @@ async def run_migration(db: Session = Depends(get_db)):
 
 
 @app.post("/api/admin/trigger-project-creation")
-def trigger_project_creation(db: Session = Depends(get_db)):
+def trigger_project_creation():
     """
     ADMIN ENDPOINT: Manually trigger project creation for pending contacts
+    
+    Runs the scheduled project creation job now instead of creating projects
+    on the request thread, which would hold a web worker for the whole batch.
+    Progress shows up in the project creation logs.
     """
     try:
         logger.info("Manual project creation trigger...")
         
-        # Get the project creator instance
-        project_creator = AlbiwareProjectCreator(
-            albiware_email=settings.albiware_email,
-            albiware_password=settings.albiware_password
-        )
-        
-        # Process pending projects
-        projects_created = project_creator.process_pending_projects(db)
+        # If the job is already running, that run picks up the pending contacts
+        scheduler.modify_job('project_creation_job', next_run_time=datetime.now())
         
         return {
             "success": True,
-            "message": f"Project creation completed",
-            "projects_created": projects_created
+            "message": "Project creation queued"
         }
         
     except Exception as e:
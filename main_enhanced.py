@@ -11,6 +11,8 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
 import logging
+import logging.handlers
+import queue
 import sys
 
 from config.settings import settings
@@ -22,14 +24,19 @@ from services.sms_service import SMSService
 from services.notification_engine import NotificationEngine
 from services.contact_monitor import ContactMonitor
 from services.conversation_handler import ConversationHandler
-from services.project_creator import AlbiwareProjectCreator
-
-# Configure logging
+from services.project_creator import AlbiwareProjectCreator, ProjectCreatorPool
+
+# Configure logging. Records go through a queue so browser workers and
+# request threads never block on stdout; the listener thread does the writing.
+log_stream_handler = logging.StreamHandler(sys.stdout)
+log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, log_stream_handler)
+log_listener.start()
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(sys.stdout)
+        logging.handlers.QueueHandler(log_queue)
     ]
 )
 
@@ -61,10 +68,19 @@ notification_engine = NotificationEngine(
 contact_monitor = ContactMonitor(albiware_client, sms_service)
 conversation_handler = ConversationHandler(sms_service)
 
-# Initialize project creator (with Albiware credentials)
-project_creator = AlbiwareProjectCreator(
-    albiware_email=settings.albiware_email,
-    albiware_password=settings.albiware_password
+# Initialize project creator pool (with Albiware credentials)
+# One warm creator shared by every caller caps Chromium at project_creator_workers
+# and keeps overlapping runs from picking up the same pending contacts
+project_creator_pool = ProjectCreatorPool(
+    lambda: AlbiwareProjectCreator(
+        albiware_email=settings.albiware_email,
+        albiware_password=settings.albiware_password,
+        max_workers=settings.project_creator_workers,
+        cdp_endpoint=settings.albiware_cdp_endpoint or None,
+        debug_screenshots=settings.debug_screenshots,
+        rate_limit=settings.project_creator_rate
+    ),
+    max_size=1
 )
 
 # Initialize scheduler
@@ -146,7 +162,8 @@ def scheduled_project_creation():
     db = next(db_gen)
     
     try:
-        projects_created = project_creator.process_pending_projects(db)
+        with project_creator_pool.acquire() as project_creator:
+            projects_created = project_creator.process_pending_projects(db)
         logger.info(f"Created {projects_created} projects")
         
     except Exception as e:
@@ -204,6 +221,8 @@ async def shutdown_event():
     """Shutdown scheduler on application shutdown."""
     logger.info("Shutting down Enhanced Albiware Agent...")
     scheduler.shutdown()
+    project_creator_pool.close()
+    log_listener.stop()
 
 
 @app.get("/", response_class=HTMLResponse)
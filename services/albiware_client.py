@@ -4,7 +4,9 @@ Handles all interactions with the Albiware API for retrieving project and task d
 """
 
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Iterator, List, Dict, Optional
 from datetime import datetime
 import logging
 
@@ -28,6 +30,18 @@ class AlbiwareClient:
             "apikey": api_key,
             "accept": "application/json"
         }
+        
+        # One pooled keep-alive session so repeated and concurrent calls
+        # reuse TCP/TLS connections instead of handshaking every time
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def get_all_projects(self, open_only: bool = True, page: int = 1, page_size: int = 100) -> List[Dict]:
         """
@@ -49,7 +63,7 @@ class AlbiwareClient:
         }
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             response_data = response.json()
             data = response_data.get('data', [])
@@ -72,7 +86,7 @@ class AlbiwareClient:
         url = f"{self.base_url}/Integrations/Projects/{project_id}"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -101,7 +115,7 @@ class AlbiwareClient:
             params["projectId"] = project_id
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             response_data = response.json()
             data = response_data.get('data', [])
@@ -111,6 +125,30 @@ class AlbiwareClient:
             logger.error(f"Error retrieving tasks from Albiware: {e}")
             return []
     
+    def iter_tasks(self, project_id: Optional[int] = None, page_size: int = 100, start_page: int = 1) -> Iterator[Dict]:
+        """
+        Yield tasks from Albiware across all pages.
+        
+        Pages are fetched lazily, so only one page is held at a time.
+        
+        Args:
+            project_id: Optional project ID to filter tasks
+            page_size: Number of results per page
+            start_page: First page to fetch (for callers that already hold earlier pages)
+            
+        Yields:
+            Task dictionaries
+        """
+        page = start_page
+        while True:
+            tasks = self.get_all_tasks(project_id=project_id, page=page, page_size=page_size)
+            yield from tasks
+            
+            # A short page is the last one (errors also come back empty)
+            if len(tasks) < page_size:
+                return
+            page += 1
+    
     def get_task_by_id(self, task_id: int) -> Optional[Dict]:
         """
         Retrieve a specific task by ID.
@@ -124,7 +162,7 @@ class AlbiwareClient:
         url = f"{self.base_url}/Integrations/Tasks/{task_id}"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -144,7 +182,7 @@ class AlbiwareClient:
         url = f"{self.base_url}/Integrations/Projects/{project_id}/Timeline"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -164,7 +202,7 @@ class AlbiwareClient:
         url = f"{self.base_url}/Integrations/Projects/{project_id}/Staff"
         
         try:
-            response = requests.post(url, headers=self.headers)
+            response = self.session.post(url)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -189,7 +227,7 @@ class AlbiwareClient:
         }
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             response_data = response.json()
             data = response_data.get('data', [])
@@ -710,7 +710,7 @@ class ConversationHandler:
     def _handle_appointment_datetime(self, db: Session, conversation: SMSConversation, message_body: str) -> bool:
         """Handle appointment date/time response and create calendar event"""
         from utils.datetime_parser import DateTimeParser
-        from services.google_calendar_service import GoogleCalendarService
+        from services.google_calendar_service import GoogleCalendarService, CalendarUnavailable
         
         contact = conversation.contact
         
@@ -755,10 +755,12 @@ class ConversationHandler:
                 contact.calendar_event_id = existing_event.get('id')
                 
                 formatted_dt = DateTimeParser.format_datetime_for_sms(appointment_dt)
+                # A stale match comes from the last calendar copy fetched before Google errored
+                stale_note = " (per the last calendar copy; Google Calendar is unreachable)" if existing_event.get('_stale') else ""
                 self.sms_service.send_sms(
                     to_number=conversation.technician_phone,
                     message=(
-                        f"✓ Appointment for {contact.full_name} on {formatted_dt} is already in the calendar.\n\n"
+                        f"✓ Appointment for {contact.full_name} on {formatted_dt} is already in the calendar{stale_note}.\n\n"
                         f"Now I need a few details to create the project."
                     ),
                     contact_id=contact.id,
@@ -810,6 +812,8 @@ class ConversationHandler:
                     else:
                         conflict_time = "that time"
                     
+                    stale_note = "(from the last calendar copy; Google Calendar is unreachable)\n" if conflicting_event.get('_stale') else ""
+                    
                     # Send warning and ask for confirmation
                     conversation.state = ConversationState.AWAITING_APPOINTMENT_CONFLICT_CONFIRMATION
                     
@@ -819,7 +823,8 @@ class ConversationHandler:
                             f"⚠️ TIME SLOT CONFLICT\n\n"
                             f"There is already an appointment scheduled:\n"
                             f"• {conflict_summary}\n"
-                            f"• {conflict_time}\n\n"
+                            f"• {conflict_time}\n"
+                            f"{stale_note}\n"
                             f"Do you still want to schedule {contact.full_name} for {formatted_dt}?\n\n"
                             f"Reply YES to confirm or NO to choose a different time."
                         ),
@@ -887,6 +892,24 @@ class ConversationHandler:
                         db=db
                     )
             
+        except CalendarUnavailable as e:
+            # Can't tell whether the slot is free - never book blind, let the technician decide
+            logger.error(f"Calendar unavailable, not booking {contact.full_name} without confirmation: {e}")
+            conversation.state = ConversationState.AWAITING_APPOINTMENT_CONFLICT_CONFIRMATION
+            
+            formatted_dt = DateTimeParser.format_datetime_for_sms(appointment_dt)
+            self.sms_service.send_sms(
+                to_number=conversation.technician_phone,
+                message=(
+                    f"⚠️ I couldn't check Google Calendar for conflicts right now, so "
+                    f"{contact.full_name} has NOT been booked for {formatted_dt}.\n\n"
+                    f"Reply YES to add it anyway or NO to choose a different time."
+                ),
+                contact_id=contact.id,
+                conversation_id=conversation.id,
+                db=db
+            )
+            
         except Exception as e:
             logger.error(f"Error creating calendar appointment: {e}")
             # Continue with project creation even if calendar fails
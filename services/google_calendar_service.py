@@ -4,20 +4,62 @@ Handles appointment creation and management in Google Calendar
 """
 
 import logging
-import json
 import os
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from urllib.parse import quote
+import requests
 from googleapiclient.errors import HttpError
 
+from services.google_json import post_json, shared_session, thread_service
+
 logger = logging.getLogger(__name__)
 
+CALENDAR_API_URL = "https://www.googleapis.com/calendar/v3"
+
+
+class CalendarUnavailable(Exception):
+    """Google Calendar could not be read, so a slot cannot be confirmed free"""
+
 
 class GoogleCalendarService:
     """Manages Google Calendar appointments"""
     
+    SCOPES = ['https://www.googleapis.com/auth/calendar']
+    
+    # In-flight events.list calls, shared across instances so concurrent
+    # callers querying the same window wait on one request to Google
+    _inflight: Dict[tuple, Future] = {}
+    _inflight_lock = threading.Lock()
+    
+    # events.list response cache: key -> (fetched_at, response)
+    _list_cache: Dict[tuple, tuple] = {}
+    _cache_lock = threading.Lock()
+    
+    # Bumped on every calendar write. A list call that started under an older
+    # generation may predate the write, so its response is neither cached nor
+    # shared with callers that arrive after the write.
+    _cache_generation = 0
+    
+    # Adaptive cache TTL: held longer while Google is rate limiting us,
+    # refreshed eagerly while the API is fast
+    LIST_CACHE_BASE_TTL = 30
+    LIST_CACHE_MIN_TTL = 5
+    LIST_CACHE_MAX_TTL = 120
+    FAST_LATENCY_SECONDS = 0.25
+    EMA_ALPHA = 0.2
+    _latency_ema = 0.0
+    _recent_429_rate = 0.0
+    
+    # Last good events.list response per window, kept past the TTL and
+    # served (tagged '_stale') when Google errors out
+    _stale_cache: Dict[tuple, Dict] = {}
+    STALE_CACHE_MAX_ENTRIES = 256
+    LIST_NUM_RETRIES = 2
+    
     def __init__(self):
         """Initialize Google Calendar API client"""
         try:
@@ -26,17 +68,13 @@ class GoogleCalendarService:
             if not creds_json:
                 raise ValueError("GOOGLE_CALENDAR_CREDENTIALS environment variable not set")
             
-            # Parse credentials
-            creds_dict = json.loads(creds_json)
+            # Calendar service, built once per thread and reused by later instances
+            self.service = thread_service('calendar', 'v3', creds_json, self.SCOPES)
+            self._events = self.service.events()
             
-            # Create credentials object
-            credentials = service_account.Credentials.from_service_account_info(
-                creds_dict,
-                scopes=['https://www.googleapis.com/auth/calendar']
-            )
-            
-            # Build calendar service
-            self.service = build('calendar', 'v3', credentials=credentials)
+            # Direct session for hot write paths (skips the discovery method chain);
+            # shared process-wide so its connection pool outlives this instance
+            self._session = shared_session(creds_json, self.SCOPES)
             
             # Get calendar ID from environment
             self.calendar_id = os.getenv('GOOGLE_CALENDAR_ID')
@@ -101,17 +139,19 @@ class GoogleCalendarService:
             }
             
             # Insert event
-            created_event = self.service.events().insert(
-                calendarId=self.calendar_id,
-                body=event
-            ).execute()
+            created_event = post_json(
+                self._session,
+                f"{CALENDAR_API_URL}/calendars/{quote(self.calendar_id, safe='')}/events",
+                event
+            )
             
             event_id = created_event.get('id')
+            self._invalidate_list_cache()
             logger.info(f"✓ Created calendar appointment for {customer_name}: {event_id}")
             
             return event_id
             
-        except HttpError as e:
+        except requests.exceptions.RequestException as e:
             logger.error(f"HTTP error creating appointment: {e}")
             return None
         except Exception as e:
@@ -135,7 +175,12 @@ class GoogleCalendarService:
             tolerance_hours: How many hours before/after to search (default 24)
             
         Returns:
-            Existing event dict if found, None otherwise
+            Existing event dict if found (with '_stale': True when served
+            from the stale cache during an API error), None otherwise
+            
+        Raises:
+            CalendarUnavailable: Google could not be read and no cached copy
+                shows a match, so the absence of a duplicate is unknown
         """
         try:
             # Search window
@@ -143,15 +188,10 @@ class GoogleCalendarService:
             time_max = (appointment_datetime + timedelta(hours=tolerance_hours)).isoformat() + 'Z'
             
             # Query events
-            events_result = self.service.events().list(
-                calendarId=self.calendar_id,
-                timeMin=time_min,
-                timeMax=time_max,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
+            events_result = self._cached_list(time_min, time_max)
             
             events = events_result.get('items', [])
+            is_stale = events_result.get('_stale', False)
             
             # Check for matching customer name or address
             for event in events:
@@ -161,16 +201,17 @@ class GoogleCalendarService:
                 if (customer_name.lower() in summary or 
                     customer_address.lower() in location):
                     logger.info(f"Found duplicate appointment for {customer_name}: {event.get('id')}")
-                    return event
+                    return dict(event, _stale=True) if is_stale else event
             
+            if is_stale:
+                raise CalendarUnavailable("Calendar unreachable; cached copy shows no duplicate")
             return None
             
-        except HttpError as e:
-            logger.error(f"HTTP error checking duplicates: {e}")
-            return None
+        except CalendarUnavailable:
+            raise
         except Exception as e:
             logger.error(f"Error checking duplicates: {e}")
-            return None
+            raise CalendarUnavailable(str(e)) from e
     
     def check_time_slot_conflict(
         self,
@@ -185,20 +226,22 @@ class GoogleCalendarService:
             duration_hours: Duration of appointment in hours (default 2)
             
         Returns:
-            Conflicting event dict if found, None if slot is free
+            Conflicting event dict if found (with '_stale': True when served
+            from the stale cache during an API error), None if slot is free
+            
+        Raises:
+            CalendarUnavailable: Google could not be read and no cached copy
+                shows a conflict, so the slot cannot be confirmed free
         """
         try:
             # Calculate time window for the appointment
             end_datetime = appointment_datetime + timedelta(hours=duration_hours)
             
             # Query events in this time range
-            events_result = self.service.events().list(
-                calendarId=self.calendar_id,
-                timeMin=appointment_datetime.isoformat() + 'Z',
-                timeMax=end_datetime.isoformat() + 'Z',
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
+            events_result = self._cached_list(
+                appointment_datetime.isoformat() + 'Z',
+                end_datetime.isoformat() + 'Z'
+            )
             
             events = events_result.get('items', [])
             
@@ -206,16 +249,153 @@ class GoogleCalendarService:
                 # Return the first conflicting event
                 conflicting_event = events[0]
                 logger.info(f"Found time slot conflict: {conflicting_event.get('summary')} at {conflicting_event.get('start')}")
+                if events_result.get('_stale'):
+                    return dict(conflicting_event, _stale=True)
                 return conflicting_event
             
+            if events_result.get('_stale'):
+                raise CalendarUnavailable("Calendar unreachable; cached copy shows the slot free")
             return None
             
-        except HttpError as e:
-            logger.error(f"HTTP error checking time slot: {e}")
-            return None
+        except CalendarUnavailable:
+            raise
         except Exception as e:
             logger.error(f"Error checking time slot: {e}")
-            return None
+            raise CalendarUnavailable(str(e)) from e
+    
+    def _list_events(self, time_min: str, time_max: str, generation: int) -> Dict:
+        """
+        List events in a time window, coalescing identical concurrent requests
+        
+        The first caller for a window issues the API request; callers that
+        arrive while it is in flight wait on the same result. Requests are
+        only joined within one cache generation, so nobody who arrives after
+        a write waits on a request that started before it.
+        
+        Args:
+            time_min: RFC3339 lower bound
+            time_max: RFC3339 upper bound
+            generation: Cache generation when the caller started
+            
+        Returns:
+            events.list response dict
+        """
+        key = (self.calendar_id, time_min, time_max, generation)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_owner:
+            return future.result()
+        
+        started = time.monotonic()
+        try:
+            result = self._events.list(
+                calendarId=self.calendar_id,
+                timeMin=time_min,
+                timeMax=time_max,
+                singleEvents=True,
+                orderBy='startTime'
+            ).execute(num_retries=self.LIST_NUM_RETRIES)
+            self._record_api_call(time.monotonic() - started, rate_limited=False)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            if isinstance(e, HttpError) and e.resp.status == 429:
+                self._record_api_call(time.monotonic() - started, rate_limited=True)
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _cached_list(self, time_min: str, time_max: str) -> Dict:
+        """
+        List events in a time window, serving recent responses from cache
+        
+        If Google fails (after retries) and an older response for the same
+        window exists, that response is returned with '_stale': True. Callers
+        may trust events found in it, but not the absence of events.
+        
+        Args:
+            time_min: RFC3339 lower bound
+            time_max: RFC3339 upper bound
+            
+        Returns:
+            events.list response dict
+            
+        Raises:
+            CalendarUnavailable: Google failed and there is no older response
+        """
+        key = (self.calendar_id, time_min, time_max)
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._list_cache.get(key)
+            generation = GoogleCalendarService._cache_generation
+        if cached and now - cached[0] < self._cache_ttl():
+            return cached[1]
+        
+        try:
+            result = self._list_events(time_min, time_max, generation)
+        except Exception as e:
+            with self._cache_lock:
+                stale = self._stale_cache.get(key)
+            if stale is None:
+                logger.error(f"Calendar events unavailable for {time_min} - {time_max}: {e}")
+                raise CalendarUnavailable(str(e)) from e
+            logger.warning(f"Serving stale calendar events for {time_min} - {time_max} after error: {e}")
+            return {'items': stale.get('items', []), '_stale': True}
+        
+        fetched_at = time.monotonic()
+        with self._cache_lock:
+            if GoogleCalendarService._cache_generation != generation:
+                # A write landed while this call was in flight; the response
+                # may not include it, so only this caller gets to see it
+                return result
+            
+            # Prune entries no TTL could still serve
+            expired = [k for k, (ts, _) in self._list_cache.items()
+                       if fetched_at - ts >= self.LIST_CACHE_MAX_TTL]
+            for k in expired:
+                del self._list_cache[k]
+            self._list_cache[key] = (fetched_at, result)
+            
+            self._stale_cache.pop(key, None)
+            self._stale_cache[key] = result
+            while len(self._stale_cache) > self.STALE_CACHE_MAX_ENTRIES:
+                del self._stale_cache[next(iter(self._stale_cache))]
+        return result
+    
+    def _cache_ttl(self) -> float:
+        """Current events.list cache TTL in seconds"""
+        cls = type(self)
+        ttl = cls.LIST_CACHE_BASE_TTL * (1 + cls._recent_429_rate * 4)
+        if cls._recent_429_rate < 0.01 and cls._latency_ema < cls.FAST_LATENCY_SECONDS:
+            ttl /= 2
+        return max(cls.LIST_CACHE_MIN_TTL, min(ttl, cls.LIST_CACHE_MAX_TTL))
+    
+    def _record_api_call(self, latency: float, rate_limited: bool):
+        """Fold one events.list call into the latency and 429-rate EMAs"""
+        cls = type(self)
+        alpha = cls.EMA_ALPHA
+        with cls._cache_lock:
+            cls._latency_ema = (1 - alpha) * cls._latency_ema + alpha * latency
+            cls._recent_429_rate = (1 - alpha) * cls._recent_429_rate + alpha * (1.0 if rate_limited else 0.0)
+    
+    def _invalidate_list_cache(self):
+        """
+        Drop cached events.list responses after a calendar write
+        
+        The stale copies predate the write too, so they go as well; the
+        generation bump keeps in-flight calls from caching over the write.
+        """
+        with self._cache_lock:
+            GoogleCalendarService._cache_generation += 1
+            self._list_cache.clear()
+            self._stale_cache.clear()
     
     def get_appointment(self, event_id: str) -> Optional[Dict]:
         """
@@ -228,7 +408,7 @@ class GoogleCalendarService:
             Event dict if found, None otherwise
         """
         try:
-            event = self.service.events().get(
+            event = self._events.get(
                 calendarId=self.calendar_id,
                 eventId=event_id
             ).execute()
@@ -290,11 +470,12 @@ class GoogleCalendarService:
                 }
             
             # Update event
-            self.service.events().update(
+            self._events.update(
                 calendarId=self.calendar_id,
                 eventId=event_id,
                 body=event
             ).execute()
+            self._invalidate_list_cache()
             
             logger.info(f"✓ Updated calendar appointment: {event_id}")
             return True
@@ -317,10 +498,11 @@ class GoogleCalendarService:
             True if successful, False otherwise
         """
         try:
-            self.service.events().delete(
+            self._events.delete(
                 calendarId=self.calendar_id,
                 eventId=event_id
             ).execute()
+            self._invalidate_list_cache()
             
             logger.info(f"✓ Deleted calendar appointment: {event_id}")
             return True
@@ -0,0 +1,164 @@
+"""
+Google API JSON Helpers
+Fast JSON decoding for Google service-account credentials and API responses,
+plus the process-wide authorized clients the services share
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+import orjson
+from google.auth.transport.requests import AuthorizedSession
+from google.oauth2 import service_account
+from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
+
+# Shared per (credentials JSON, scopes): services are constructed per request,
+# but the credentials (and their cached token) and the pooled session are not
+_credentials: Dict[Tuple[str, tuple], service_account.Credentials] = {}
+_sessions: Dict[Tuple[str, tuple], AuthorizedSession] = {}
+_clients_lock = threading.Lock()
+
+# Discovery-built services sit on httplib2, which is not thread-safe,
+# so each thread keeps its own copy instead of sharing one
+_thread_services = threading.local()
+
+
+def load_credentials_info(creds_json: str) -> dict:
+    """
+    Parse service-account credentials JSON
+
+    Args:
+        creds_json: Raw JSON string from the environment
+
+    Returns:
+        Credentials dictionary
+    """
+    return orjson.loads(creds_json)
+
+
+def shared_credentials(creds_json: str, scopes: list) -> service_account.Credentials:
+    """
+    Service-account credentials for this JSON and scope set, built once per process
+
+    Args:
+        creds_json: Raw JSON string from the environment
+        scopes: OAuth scopes to request
+
+    Returns:
+        Shared credentials object
+    """
+    key = (creds_json, tuple(scopes))
+    with _clients_lock:
+        credentials = _credentials.get(key)
+        if credentials is None:
+            credentials = service_account.Credentials.from_service_account_info(
+                load_credentials_info(creds_json),
+                scopes=scopes
+            )
+            _credentials[key] = credentials
+        return credentials
+
+
+def shared_session(creds_json: str, scopes: list) -> AuthorizedSession:
+    """
+    Authorized requests session for these credentials, shared process-wide
+
+    One session means one urllib3 connection pool, so repeat calls reuse
+    open TCP/TLS connections instead of each service instance leaking its own.
+
+    Args:
+        creds_json: Raw JSON string from the environment
+        scopes: OAuth scopes to request
+
+    Returns:
+        Shared authorized session
+    """
+    key = (creds_json, tuple(scopes))
+    credentials = shared_credentials(creds_json, scopes)
+    with _clients_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = AuthorizedSession(credentials)
+            _sessions[key] = session
+        return session
+
+
+def thread_service(api: str, version: str, creds_json: str, scopes: list):
+    """
+    Discovery-built API client for these credentials, built once per thread
+
+    Args:
+        api: API name (e.g. 'calendar')
+        version: API version (e.g. 'v3')
+        creds_json: Raw JSON string from the environment
+        scopes: OAuth scopes to request
+
+    Returns:
+        googleapiclient Resource
+    """
+    services = getattr(_thread_services, 'services', None)
+    if services is None:
+        services = _thread_services.services = {}
+    key = (api, version, creds_json, tuple(scopes))
+    service = services.get(key)
+    if service is None:
+        service = build(
+            api, version,
+            credentials=shared_credentials(creds_json, scopes),
+            model=OrjsonModel()
+        )
+        services[key] = service
+    return service
+
+
+class OrjsonModel(JsonModel):
+    """JsonModel that decodes API response bodies with orjson instead of stdlib json"""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Match JsonModel: non-JSON bodies are returned as text
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
+def post_json(
+    session: AuthorizedSession,
+    url: str,
+    body: Dict,
+    params: Optional[Dict] = None,
+    timeout: int = 15
+) -> Dict:
+    """
+    POST a JSON body directly over an authorized session
+
+    Bypasses the discovery-built request chain for hot write paths while
+    reusing the session's pooled TCP/TLS connections.
+
+    Args:
+        session: Authorized requests session for the service account
+        url: Full REST endpoint URL
+        body: Request body
+        params: Optional query parameters
+        timeout: Request timeout in seconds
+
+    Returns:
+        Decoded response body
+
+    Raises:
+        requests.exceptions.RequestException: On transport or HTTP errors
+    """
+    response = session.post(
+        url,
+        data=orjson.dumps(body),
+        params=params,
+        headers={'Content-Type': 'application/json'},
+        timeout=timeout
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
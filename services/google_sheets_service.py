@@ -4,16 +4,18 @@ Handles logging equipment data to Google Sheets
 """
 
 import os
-import json
 import logging
 from datetime import datetime
 from typing import Optional
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from urllib.parse import quote
 from googleapiclient.errors import HttpError
 
+from services.google_json import post_json, shared_session, thread_service
+
 logger = logging.getLogger(__name__)
 
+SHEETS_API_URL = "https://sheets.googleapis.com/v4"
+
 
 class GoogleSheetsService:
     """Service for logging equipment data to Google Sheets"""
@@ -25,6 +27,8 @@ class GoogleSheetsService:
         """Initialize Google Sheets service"""
         self.service = None
         self.sheet_id = None
+        self._session = None
+        self._spreadsheets = None
         self._initialize_service()
     
     def _initialize_service(self):
@@ -36,17 +40,13 @@ class GoogleSheetsService:
                 logger.error("GOOGLE_CALENDAR_CREDENTIALS not found in environment")
                 return
             
-            # Parse credentials
-            creds_dict = json.loads(creds_json)
+            # Sheets service, built once per thread and reused by later instances
+            self.service = thread_service('sheets', 'v4', creds_json, self.SCOPES)
+            self._spreadsheets = self.service.spreadsheets()
             
-            # Create credentials
-            credentials = service_account.Credentials.from_service_account_info(
-                creds_dict,
-                scopes=self.SCOPES
-            )
-            
-            # Build service
-            self.service = build('sheets', 'v4', credentials=credentials)
+            # Direct session for the append hot path (skips the discovery method chain);
+            # shared process-wide so its connection pool outlives this instance
+            self._session = shared_session(creds_json, self.SCOPES)
             
             # Get or create equipment tracking sheet
             self.sheet_id = self._get_or_create_sheet()
@@ -70,7 +70,7 @@ class GoogleSheetsService:
             
             # Verify sheet exists and is accessible
             try:
-                self.service.spreadsheets().get(spreadsheetId=sheet_id).execute()
+                self._spreadsheets.get(spreadsheetId=sheet_id).execute()
                 logger.info(f"Using Project Equipment Tracker sheet: {sheet_id}")
                 return sheet_id
             except HttpError as e:
@@ -107,13 +107,12 @@ class GoogleSheetsService:
             row = [[customer_name, address, formatted_date, equipment_list]]
             
             # Append to sheet (using Sheet1 as the default sheet name)
-            self.service.spreadsheets().values().append(
-                spreadsheetId=self.sheet_id,
-                range='Sheet1!A:D',
-                valueInputOption='RAW',
-                insertDataOption='INSERT_ROWS',
-                body={'values': row}
-            ).execute()
+            post_json(
+                self._session,
+                f"{SHEETS_API_URL}/spreadsheets/{self.sheet_id}/values/{quote('Sheet1!A:D', safe='')}:append",
+                {'values': row},
+                params={'valueInputOption': 'RAW', 'insertDataOption': 'INSERT_ROWS'}
+            )
             
             logger.info(f"Logged equipment for {customer_name} to Google Sheets")
             return True
@@ -3,27 +3,60 @@ Notification Engine
 Core logic for determining when to send notifications and tracking task completion.
 """
 
-from typing import List, Dict, Optional
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
+from collections import deque
+from itertools import islice
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timedelta
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+import ciso8601
 import logging
+import threading
 
+from database.database import no_expire_on_commit
 from database.models import Task, Notification, TaskCompletionLog, SystemLog
 from services.albiware_client import AlbiwareClient
 from services.sms_service import SMSService
 
 logger = logging.getLogger(__name__)
 
+# Sent notifications are committed in chunks of this size as sends complete,
+# so a crash only loses the send records since the last chunk commit
+NOTIFICATION_COMMIT_CHUNK = 50
+
+# Tasks handled per existing-row lookup during sync
+SYNC_WINDOW_SIZE = 500
+
+# Albiware task page size, and how many projects ahead of the sync loop have
+# their first page fetched (one fetch thread per prefetched project)
+TASK_PAGE_SIZE = 100
+TASK_PREFETCH_PROJECTS = 8
+
+
+def _batched(items: Iterable, size: int) -> Iterator[List]:
+    """Yield lists of up to size items from an iterable."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
 
 class NotificationEngine:
     """Engine for managing task notifications and tracking."""
     
+    # How often overdue tasks are re-notified
+    OVERDUE_REMINDER_INTERVAL = timedelta(hours=24)
+    
     def __init__(
         self,
         albiware_client: AlbiwareClient,
         sms_service: SMSService,
         reminder_hours_before_due: int = 24,
-        max_reminders_per_task: int = 5
+        max_reminders_per_task: int = 5,
+        session_factory: Optional[Callable[[], Session]] = None
     ):
         """
         Initialize the notification engine.
@@ -33,11 +66,62 @@ class NotificationEngine:
             sms_service: SMS service for sending notifications
             reminder_hours_before_due: Hours before due date to send first reminder
             max_reminders_per_task: Maximum number of reminders per task
+            session_factory: Creates sessions for work run on the background executor
         """
         self.albiware_client = albiware_client
         self.sms_service = sms_service
         self.reminder_hours_before_due = reminder_hours_before_due
         self.max_reminders_per_task = max_reminders_per_task
+        
+        # Twilio sends are I/O bound; overlap them instead of sending serially
+        self._sms_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='sms')
+        
+        # One notification run at a time: scheduled and on-demand runs would
+        # otherwise both send the same reminders
+        self._notify_lock = threading.Lock()
+        
+        # Per-project Albiware task fetches are independent HTTP calls
+        self._fetch_pool = ThreadPoolExecutor(max_workers=TASK_PREFETCH_PROJECTS, thread_name_prefix='albiware-fetch')
+        
+        # Background runner for the sync/notify pipeline. A single worker keeps
+        # submissions ordered (sync before notify) and never overlaps two runs.
+        self.session_factory = session_factory
+        self._exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='notification-engine')
+    
+    def sync_tasks_from_albiware_async(self) -> Future:
+        """
+        Queue a task sync on the background executor and return immediately.
+        
+        Returns:
+            Future resolving to the number of tasks synced
+        """
+        return self._exec.submit(self._run_in_session, self.sync_tasks_from_albiware)
+    
+    def process_task_notifications_async(self, staff_phone_numbers: List[str]) -> Future:
+        """
+        Queue task notification processing on the background executor and return immediately.
+        
+        Args:
+            staff_phone_numbers: List of staff phone numbers to notify
+            
+        Returns:
+            Future resolving to the number of notifications sent
+        """
+        return self._exec.submit(self._run_in_session, self.process_task_notifications, staff_phone_numbers)
+    
+    def _run_in_session(self, operation: Callable, *args):
+        """Run operation with a session owned by the executor thread (never the caller's)."""
+        if self.session_factory is None:
+            raise RuntimeError("NotificationEngine needs a session_factory for background work")
+        
+        db = self.session_factory()
+        try:
+            return operation(db, *args)
+        except Exception as e:
+            logger.error(f"Background {operation.__name__} failed: {e}")
+            raise
+        finally:
+            db.close()
     
     def sync_tasks_from_albiware(self, db: Session) -> int:
         """
@@ -54,54 +138,66 @@ class NotificationEngine:
             projects = self.albiware_client.get_all_projects(open_only=True)
             tasks_synced = 0
             
-            for project in projects:
+            # Tasks stream in page by page with a bounded prefetch; DB writes stay on this thread
+            for project, tasks in self._iter_project_tasks(projects):
                 project_id = project.get('id')
                 project_name = project.get('name', 'Unknown Project')
+                existing_tasks = {}
                 
-                # Get tasks for this project
-                tasks = self.albiware_client.get_all_tasks(project_id=project_id)
-                
-                for task_data in tasks:
-                    task_id = task_data.get('id')
-                    
-                    # Check if task already exists
-                    existing_task = db.query(Task).filter(
-                        Task.albiware_task_id == task_id
-                    ).first()
+                # Look up existing rows in bounded windows so large projects
+                # don't build one huge IN clause
+                for window in _batched(tasks, SYNC_WINDOW_SIZE):
+                    task_ids = [t.get('id') for t in window if t.get('id') is not None]
+                    if task_ids:
+                        existing_tasks.update(
+                            (t.albiware_task_id, t)
+                            for t in db.query(Task).filter(Task.albiware_task_id.in_(task_ids)).all()
+                        )
+                    new_tasks = []
                     
-                    if existing_task:
-                        # Update existing task
-                        existing_task.task_name = task_data.get('name', 'Unnamed Task')
-                        existing_task.status = task_data.get('status', 'unknown')
-                        existing_task.assigned_to = task_data.get('assignedTo')
-                        existing_task.updated_at = datetime.utcnow()
+                    for task_data in window:
+                        task_id = task_data.get('id')
                         
-                        # Check if task was completed
-                        if task_data.get('status') == 'completed' and not existing_task.completed_at:
-                            existing_task.completed_at = datetime.utcnow()
-                            self._log_task_completion(db, existing_task)
-                    else:
-                        # Create new task
-                        due_date_str = task_data.get('dueDate')
-                        due_date = None
-                        if due_date_str:
-                            try:
-                                due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
-                            except:
-                                pass
+                        # Check if task already exists
+                        existing_task = existing_tasks.get(task_id)
                         
-                        new_task = Task(
-                            albiware_task_id=task_id,
-                            task_name=task_data.get('name', 'Unnamed Task'),
-                            project_id=project_id,
-                            project_name=project_name,
-                            due_date=due_date,
-                            status=task_data.get('status', 'unknown'),
-                            assigned_to=task_data.get('assignedTo')
-                        )
-                        db.add(new_task)
+                        if existing_task:
+                            # Update existing task
+                            existing_task.task_name = task_data.get('name', 'Unnamed Task')
+                            existing_task.status = task_data.get('status', 'unknown')
+                            existing_task.assigned_to = task_data.get('assignedTo')
+                            existing_task.updated_at = datetime.utcnow()
+                        
+                            # Check if task was completed
+                            if task_data.get('status') == 'completed' and not existing_task.completed_at:
+                                existing_task.completed_at = datetime.utcnow()
+                                self._log_task_completion(db, existing_task)
+                        else:
+                            # Create new task
+                            due_date_str = task_data.get('dueDate')
+                            due_date = None
+                            if due_date_str:
+                                try:
+                                    due_date = ciso8601.parse_datetime(due_date_str)
+                                except (ValueError, TypeError) as e:
+                                    # Without a due date the task never gets reminders
+                                    logger.warning(f"Bad due_date {due_date_str!r} for task {task_id}: {e}")
+                        
+                            new_task = Task(
+                                albiware_task_id=task_id,
+                                task_name=task_data.get('name', 'Unnamed Task'),
+                                project_id=project_id,
+                                project_name=project_name,
+                                due_date=due_date,
+                                status=task_data.get('status', 'unknown'),
+                                assigned_to=task_data.get('assignedTo')
+                            )
+                            new_tasks.append(new_task)
+                            existing_tasks[task_id] = new_task
+                        
+                        tasks_synced += 1
                     
-                    tasks_synced += 1
+                    db.add_all(new_tasks)
             
             db.commit()
             logger.info(f"Synced {tasks_synced} tasks from Albiware")
@@ -127,6 +223,43 @@ class NotificationEngine:
             db.rollback()
             return 0
     
+    def _iter_project_tasks(self, projects: List[Dict]) -> Iterator[Tuple[Dict, Iterator[Dict]]]:
+        """
+        Yield each project with a lazy iterator over its tasks, in order.
+        
+        The first page of the next TASK_PREFETCH_PROJECTS projects is fetched
+        concurrently on the fetch pool; later pages are fetched as the caller
+        reaches them. Peak memory is a few pages, not every open task.
+        
+        Args:
+            projects: Projects to fetch tasks for
+            
+        Yields:
+            (project, task iterator)
+        """
+        def first_page(project: Dict) -> List[Dict]:
+            return self.albiware_client.get_all_tasks(project_id=project.get('id'), page=1, page_size=TASK_PAGE_SIZE)
+        
+        remaining = iter(projects)
+        ahead = deque(
+            (project, self._fetch_pool.submit(first_page, project))
+            for project in islice(remaining, TASK_PREFETCH_PROJECTS)
+        )
+        while ahead:
+            project, future = ahead.popleft()
+            for next_project in islice(remaining, 1):
+                ahead.append((next_project, self._fetch_pool.submit(first_page, next_project)))
+            yield project, self._project_tasks(project, future.result())
+    
+    def _project_tasks(self, project: Dict, first_page: List[Dict]) -> Iterator[Dict]:
+        """Yield a project's prefetched first page, then stream any further pages."""
+        yield from first_page
+        # A short page is the last one
+        if len(first_page) >= TASK_PAGE_SIZE:
+            yield from self.albiware_client.iter_tasks(
+                project_id=project.get('id'), page_size=TASK_PAGE_SIZE, start_page=2
+            )
+    
     def process_task_notifications(self, db: Session, staff_phone_numbers: List[str]) -> int:
         """
         Process all tasks and send notifications as needed.
@@ -138,83 +271,132 @@ class NotificationEngine:
         Returns:
             Number of notifications sent
         """
-        notifications_sent = 0
-        
-        try:
-            # Get all incomplete tasks
-            incomplete_tasks = db.query(Task).filter(
-                Task.status != 'completed',
-                Task.completed_at.is_(None)
-            ).all()
-            
-            for task in incomplete_tasks:
-                # Skip tasks without due dates
-                if not task.due_date:
-                    continue
+        with self._notify_lock:
+            try:
+                # Get incomplete tasks that are due soon or overdue, with their
+                # notification count and last send time; capped tasks stay in the DB
+                now = datetime.utcnow()
+                reminder_threshold = timedelta(hours=self.reminder_hours_before_due)
+                reminder_cutoff = now + reminder_threshold
+                notification_count = func.count(Notification.id)
+                incomplete_tasks = db.query(
+                    Task,
+                    notification_count,
+                    func.max(Notification.sent_at)
+                ).outerjoin(
+                    Notification, Notification.task_id == Task.id
+                ).filter(
+                    Task.status != 'completed',
+                    Task.completed_at.is_(None),
+                    Task.due_date.isnot(None),
+                    Task.due_date <= reminder_cutoff
+                ).group_by(Task.id).having(
+                    notification_count < self.max_reminders_per_task
+                ).all()
                 
-                # Check if task needs a reminder
-                if self._should_send_reminder(db, task):
-                    for phone_number in staff_phone_numbers:
-                        if self._send_task_notification(db, task, phone_number):
-                            notifications_sent += 1
-            
-            db.commit()
-            logger.info(f"Sent {notifications_sent} notifications")
-            
-            return notifications_sent
-            
-        except Exception as e:
-            logger.error(f"Error processing task notifications: {e}")
-            self._log_system_event(
-                db,
-                event_type='error',
-                message=f'Error processing notifications: {str(e)}',
-                severity='error'
-            )
-            db.rollback()
-            return 0
+                # Check which tasks need a reminder
+                due_tasks = [
+                    task for task, count, last_sent_at in incomplete_tasks
+                    if self._should_send_reminder(task, count, last_sent_at, now, reminder_threshold)
+                ]
+                
+                # Send concurrently; workers only talk to Twilio, the session
+                # stays on this thread
+                work = [(task, phone_number) for task in due_tasks for phone_number in staff_phone_numbers]
+                futures = [
+                    self._sms_pool.submit(self._send_task_notification, task, phone_number, now)
+                    for task, phone_number in work
+                ]
+                
+                # Save rows in chunks as sends complete. The chunk commits must not
+                # expire the Task rows the SMS workers are still reading.
+                notifications_sent = 0
+                pending = []
+                try:
+                    with no_expire_on_commit(db):
+                        for future in as_completed(futures):
+                            notification = future.result()
+                            if notification is None:
+                                continue
+                            pending.append(notification)
+                            if len(pending) >= NOTIFICATION_COMMIT_CHUNK:
+                                self._save_notifications(db, pending)
+                                notifications_sent += len(pending)
+                                pending = []
+                        self._save_notifications(db, pending)
+                        notifications_sent += len(pending)
+                finally:
+                    # Never let the next run start while this run's workers are
+                    # still sending, or it could pick the same tasks again
+                    wait(futures)
+                
+                logger.info(f"Sent {notifications_sent} notifications")
+                
+                return notifications_sent
+                
+            except Exception as e:
+                logger.error(f"Error processing task notifications: {e}")
+                db.rollback()
+                self._log_system_event(
+                    db,
+                    event_type='error',
+                    message=f'Error processing notifications: {str(e)}',
+                    severity='error'
+                )
+                return 0
     
-    def _should_send_reminder(self, db: Session, task: Task) -> bool:
+    def _save_notifications(self, db: Session, notifications: List[Notification]):
         """
-        Determine if a task should receive a reminder.
+        Bulk insert and commit one chunk of sent notifications.
         
         Args:
             db: Database session
+            notifications: Sent, unsaved notifications
+        """
+        if not notifications:
+            return
+        db.bulk_save_objects(notifications)
+        db.commit()
+    
+    def _should_send_reminder(
+        self,
+        task: Task,
+        notification_count: int,
+        last_sent_at: Optional[datetime],
+        now: datetime,
+        reminder_threshold: timedelta
+    ) -> bool:
+        """
+        Determine if a task should receive a reminder.
+        
+        Args:
             task: Task to check
+            notification_count: Notifications already sent for this task
+            last_sent_at: When the most recent notification was sent, if any
+            now: Current time for this processing run
+            reminder_threshold: How long before the due date the first reminder goes out
             
         Returns:
             True if reminder should be sent, False otherwise
         """
-        # Count existing notifications for this task
-        notification_count = db.query(Notification).filter(
-            Notification.task_id == task.id
-        ).count()
-        
         # Check if max reminders reached
         if notification_count >= self.max_reminders_per_task:
             return False
         
         # Calculate time until due
-        now = datetime.utcnow()
         time_until_due = task.due_date - now
         
         # Send first reminder X hours before due date
         if notification_count == 0:
-            reminder_threshold = timedelta(hours=self.reminder_hours_before_due)
             if time_until_due <= reminder_threshold and time_until_due > timedelta(0):
                 return True
         
         # Send reminders for overdue tasks
         if time_until_due < timedelta(0):
-            # Get last notification
-            last_notification = db.query(Notification).filter(
-                Notification.task_id == task.id
-            ).order_by(Notification.sent_at.desc()).first()
-            
-            if last_notification:
+            if last_sent_at:
                 # Send reminder every 24 hours for overdue tasks
-                time_since_last = now - last_notification.sent_at
-                if time_since_last >= timedelta(hours=24):
+                time_since_last = now - last_sent_at
+                if time_since_last >= self.OVERDUE_REMINDER_INTERVAL:
                     return True
             else:
                 # No notifications sent yet, send one
@@ -222,20 +404,21 @@ class NotificationEngine:
         
         return False
     
-    def _send_task_notification(self, db: Session, task: Task, phone_number: str) -> bool:
+    def _send_task_notification(self, task: Task, phone_number: str, now: datetime) -> Optional[Notification]:
         """
         Send a notification for a specific task.
         
+        Runs on the SMS worker pool, so it must not touch the database session.
+        
         Args:
-            db: Database session
             task: Task to send notification for
             phone_number: Recipient phone number
+            now: Current time for this processing run
             
         Returns:
-            True if notification sent successfully, False otherwise
+            Unsaved Notification if sent successfully, None otherwise
         """
         try:
-            now = datetime.utcnow()
             is_overdue = task.due_date < now
             
             # Send appropriate notification type
@@ -260,26 +443,22 @@ class NotificationEngine:
                 notification_type = 'reminder'
             
             if message_sid:
-                # Log notification in database
-                notification = Notification(
+                logger.info(f"Notification sent for task {task.albiware_task_id} to {phone_number}")
+                return Notification(
                     task_id=task.id,
                     recipient_phone=phone_number,
                     message_body=f"Task reminder sent for: {task.task_name}",
                     twilio_message_sid=message_sid,
                     delivery_status='sent',
+                    sent_at=datetime.utcnow(),
                     notification_type=notification_type
                 )
-                db.add(notification)
-                db.commit()
-                
-                logger.info(f"Notification sent for task {task.albiware_task_id} to {phone_number}")
-                return True
             
-            return False
+            return None
             
         except Exception as e:
             logger.error(f"Error sending notification for task {task.id}: {e}")
-            return False
+            return None
     
     def _log_task_completion(self, db: Session, task: Task):
         """
@@ -290,19 +469,12 @@ class NotificationEngine:
             task: Completed task
         """
         try:
-            # Count notifications sent for this task
-            notification_count = db.query(Notification).filter(
-                Notification.task_id == task.id
-            ).count()
-            
-            # Get first and last notification times
-            first_notification = db.query(Notification).filter(
-                Notification.task_id == task.id
-            ).order_by(Notification.sent_at.asc()).first()
-            
-            last_notification = db.query(Notification).filter(
-                Notification.task_id == task.id
-            ).order_by(Notification.sent_at.desc()).first()
+            # Count and first/last notification times in one aggregate query
+            notification_count, first_sent_at, last_sent_at = db.query(
+                func.count(Notification.id),
+                func.min(Notification.sent_at),
+                func.max(Notification.sent_at)
+            ).filter(Notification.task_id == task.id).one()
             
             # Calculate completion metrics
             days_to_complete = None
@@ -329,8 +501,8 @@ class NotificationEngine:
                 was_overdue=was_overdue,
                 days_overdue=days_overdue,
                 total_notifications_sent=notification_count,
-                first_notification_sent_at=first_notification.sent_at if first_notification else None,
-                last_notification_sent_at=last_notification.sent_at if last_notification else None
+                first_notification_sent_at=first_sent_at,
+                last_notification_sent_at=last_sent_at
             )
             
             db.add(completion_log)
@@ -6,39 +6,283 @@ CRITICAL FIX: Properly handles Kendo dropdown widgets by simulating user interac
 instead of just setting values via jQuery
 """
 
+import atexit
+import json
 import logging
+import os
+import queue
+import re
+import threading
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, Dict
+from types import SimpleNamespace
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlparse
+from typing import Callable, Optional, Dict, Iterator, List, Tuple
 from sqlalchemy.orm import Session
-from playwright.sync_api import sync_playwright, Page, Browser, TimeoutError as PlaywrightTimeout
+from playwright.sync_api import sync_playwright, Page, Browser, Locator, Error as PlaywrightError, TimeoutError as PlaywrightTimeout
 
+from database.database import no_expire_on_commit
 from database.enhanced_models import Contact, ProjectCreationLog
 from services.property_lookup import get_year_built, format_address_for_lookup
 from services.sms_service import SMSService
+from utils.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# Resource types the automation never needs. Stylesheets are still loaded:
+# Kendo popups and the Year Built check rely on CSS visibility.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+# Third-party analytics/tracking hosts (matched on the host suffix)
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "segment.io",
+    "segment.com",
+    "hotjar.com",
+    "intercom.io",
+    "facebook.net",
+    "fullstory.com",
+)
+
+# Reference-data lookups behind the form's dropdowns. They are the same for every
+# contact, so workers share one in-memory copy instead of refetching per form.
+# Customer searches are deliberately excluded: new customers appear between runs.
+LOOKUP_URL_RE = re.compile(r'/(ProjectType|PropertyType|ReferralSource|ProjectRole|Staff|Location)', re.I)
+LOOKUP_CACHE_TTL = 10 * 60
+
+# Chromium features a headless form filler never uses. /dev/shm is tiny in
+# containers, and every worker page counts as a background tab, so shared memory
+# and timer/renderer throttling are turned off too.
+CHROMIUM_ARGS = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-dev-shm-usage",
+    "--disable-features=TranslateUI",
+    "--no-first-run",
+    "--mute-audio",
+]
+
+# Beyond this many concurrent browsers one node starts thrashing
+MAX_BROWSER_WORKERS = 8
+
+# Saved login sessions older than this are assumed expired and not reused
+LOGIN_STATE_MAX_AGE = 8 * 60 * 60
+
+# Failure screenshots (debug_screenshots only); older ones beyond the limit are pruned
+SCREENSHOT_DIR = "/tmp/albiware_screenshots"
+SCREENSHOT_KEEP = 20
+
+# Writes failure screenshots to disk off the browser worker threads
+_SCREENSHOT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='screenshot')
+
+# Project page URL after a successful create: /Project/{project_id}
+PROJECT_URL_RE = re.compile(r'/Project/(\d+)')
+
+# True once jQuery has initialized the Kendo widgets the form script drives
+KENDO_READY_JS = "() => !!(window.jQuery && jQuery('#ProjectTypeId').data('kendoDropDownList'))"
+
+# Form predicates and probes. Values are passed as evaluate() arguments rather
+# than formatted into the script, so every call reuses the same compiled function.
+FIELD_HAS_VALUE_JS = "id => !!jQuery('#' + id).val()"
+KENDO_HAS_VALUE_JS = "id => !!jQuery('#' + id).data('kendoDropDownList').value()"
+KENDO_SELECTION_JS = """
+(id) => {
+    const widget = jQuery('#' + id).data('kendoDropDownList');
+    if (!widget) return {success: false, error: 'Widget not found'};
+    return {success: !!widget.value(), value: widget.value(), text: widget.text()};
+}
+"""
+SELECT_HAS_OPTIONS_JS = "selector => document.querySelectorAll(selector + ' option').length > 1"
+SELECT_VALUE_IS_JS = "([selector, value]) => document.querySelector(selector).value === value"
+
+# Snapshot of every form field for submit diagnostics: each element is looked
+# up once, and Kendo widgets report their widget value over the raw input
+FORM_STATE_JS = """
+() => {
+    const state = {};
+    for (const id of ['CustomerOption', 'ExistingOrganizationId', 'ExistingReferralSourceId', 'ProjectTypeId',
+                      'PropertyType', 'StaffId', 'ProjectRoleId', 'CoveredLoss']) {
+        const el = document.getElementById(id);
+        const widget = el && window.jQuery && jQuery(el).data('kendoDropDownList');
+        state[id] = widget ? widget.value() : el ? el.value : null;
+    }
+    return state;
+}
+"""
+
+# Installed once per worker context with add_init_script, so every page already
+# has the form helpers and each call below sends only its arguments.
+#
+# __albiSetSelects sets native <select>s in one round trip, in order, firing the
+# same input/change events as select_option. Fields already on the target option
+# are left alone. Takes [selector, value, by_label] triples; returns selectors
+# with no matching option.
+FORM_HELPERS_JS = """
+window.__albiSetSelects = (fields) => {
+    const missing = [];
+    for (const [selector, value, byLabel] of fields) {
+        const el = document.querySelector(selector);
+        const option = el && [...el.options].find(o => byLabel ? o.label === value : o.value === value);
+        if (!option) {
+            missing.push(selector);
+            continue;
+        }
+        if (el.value === option.value) continue;
+        el.value = option.value;
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return missing;
+};
+"""
+SET_SELECTS_JS = "fields => window.__albiSetSelects(fields)"
+
+# Albiware Project Type search keyword for each contact project type
+PROJECT_TYPE_KEYWORDS = {
+    'Emergency Mitigation Services': 'Emergency',
+    'Mold': 'Mold',
+    'Reconstruction': 'Reconstruction',
+    'Sewage': 'Sewage',
+    'Biohazard': 'Biohazard',
+    'Contents': 'Contents',
+    'Vandalism': 'Vandalism'
+}
+
+# Project form selectors, bound to each page by _locators()
+FORM_SELECTORS = {
+    'customer_option': '#CustomerOption',
+    'customer_dropdown': 'span[aria-owns="ExistingOrganizationId_listbox"]',
+    'customer_search': '#ExistingOrganizationId-list input[role="listbox"]',
+    'referrer_option': '#ReferrerOption',
+    'referral_dropdown': 'span[aria-owns="ExistingReferralSourceId_listbox"]',
+    'referral_search': '#ExistingReferralSourceId-list input[role="listbox"]',
+    'project_type_dropdown': 'span[aria-owns="ProjectTypeId_listbox"]',
+    'project_type_search': 'input[role="listbox"]',
+    'property_type': '#PropertyType',
+    'year_built': '#YearBuilt, input[name="YearBuilt"]',
+    'staff': '#StaffId',
+    'project_role': '#ProjectRoleId',
+    'covered_loss': '#CoveredLoss',
+    'submit': 'input#SubmitButton[type="submit"]',
+    'validation_errors': '.field-validation-error, .validation-summary-errors',
+}
+
 
 class AlbiwareProjectCreator:
-    """Automates project creation in Albiware using browser automation"""
+    """
+    Automates project creation in Albiware using browser automation
+    
+    Browsers are long-lived: each worker thread launches Chromium once and
+    reuses one logged-in context across contacts. Workers run while the
+    creator is entered, so callers creating several projects should hold
+    it open (``with creator:`` or a ProjectCreatorPool) rather than paying
+    a browser launch per call.
+    """
     
-    def __init__(self, albiware_email: str, albiware_password: str):
+    def __init__(
+        self,
+        albiware_email: str,
+        albiware_password: str,
+        max_workers: int = 4,
+        max_uses: int = 50,
+        login_state_path: Optional[str] = "/tmp/albiware_state.json",
+        cdp_endpoint: Optional[str] = None,
+        debug_screenshots: bool = False,
+        rate_limit: float = 1.0
+    ):
         """
         Initialize the project creator
         
         Args:
             albiware_email: Albiware login email
             albiware_password: Albiware login password
+            max_workers: Number of browser workers used to process a batch in parallel (at most 8)
+            max_uses: Contexts a worker's browser serves before it is relaunched
+            login_state_path: File the logged-in session is saved to, so it survives restarts
+            cdp_endpoint: Connect to an already running Chromium over CDP instead of launching one
+            debug_screenshots: Save a screenshot of the page when a contact fails
+            rate_limit: Contacts started per second across all workers (bursts of up to 5)
         """
         self.email = albiware_email
         self.password = albiware_password
         self.albiware_url = "https://app.albiware.com"
+        self.max_workers = min(max(1, max_workers), MAX_BROWSER_WORKERS)
+        self._max_uses = max(1, max_uses)
+        self.cdp_endpoint = cdp_endpoint
+        self.debug_screenshots = debug_screenshots
+        
+        # Cached dropdown lookups: normalized URL -> (expires, status, content type, body)
+        self._lookup_cache: Dict[str, Tuple[float, int, Optional[str], bytes]] = {}
+        self._lookup_lock = threading.Lock()
+        
+        # Set once the create-project POST's field names have been logged
+        self._form_post_logged = False
+        
+        # Paces contacts across all workers; slows down when Albiware returns 429
+        self._bucket = TokenBucket(rate=rate_limit, capacity=5)
+        
+        # Cookies/localStorage from the last successful login, shared by all browser contexts
+        self._login_state_path = login_state_path
+        self._storage_state: Optional[Dict] = self._load_storage_state()
+        self._login_lock = threading.Lock()
+        
+        # Browser worker threads. Sync Playwright objects are bound to the thread
+        # that created them, so each worker owns its Playwright/Browser in _local.
+        self._work: queue.Queue = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._local = threading.local()
+        self._lifecycle_lock = threading.Lock()
+        self._depth = 0
+    
+    def start(self) -> None:
+        """Start the browser worker threads (browsers launch lazily on first use)"""
+        with self._lifecycle_lock:
+            if self._workers:
+                return
+            self._workers = [
+                threading.Thread(target=self._browser_worker, name=f"albiware-{i}", daemon=True)
+                for i in range(self.max_workers)
+            ]
+            for worker in self._workers:
+                worker.start()
+    
+    def close(self) -> None:
+        """Stop the worker threads; each closes its own browser on the way out"""
+        with self._lifecycle_lock:
+            workers, self._workers = self._workers, []
+            for _ in workers:
+                self._work.put(None)
+        for worker in workers:
+            worker.join(timeout=60)
+    
+    def __enter__(self) -> "AlbiwareProjectCreator":
+        with self._lifecycle_lock:
+            self._depth += 1
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        with self._lifecycle_lock:
+            self._depth -= 1
+            last = self._depth == 0
+        if last:
+            self.close()
     
     def create_project_for_contact(self, db: Session, contact: Contact) -> bool:
         """
         Create a project in Albiware for the given contact
         
+        Runs on a browser worker: the form helpers the fill relies on are only
+        installed in worker contexts (see _worker_page).
+        
         Args:
             db: Database session
             contact: Contact object to create project for
@@ -46,127 +290,451 @@ class AlbiwareProjectCreator:
         Returns:
             True if project created successfully
         """
-        log = ProjectCreationLog(
-            contact_id=contact.id,
-            status='pending',
-            started_at=datetime.utcnow()
+        for contact, started_at, result in self._run_batch([contact]):
+            return self._record_result(db, contact, result, started_at)
+        return False
+    
+    def _snapshot_contact(self, contact: Contact) -> SimpleNamespace:
+        """
+        Copy the fields the form needs off the ORM object
+        
+        Browser workers run on their own threads and must never touch the
+        SQLAlchemy session, so they only ever see this plain snapshot.
+        """
+        return SimpleNamespace(
+            id=contact.id,
+            full_name=contact.full_name,
+            address=contact.address,
+            project_type=contact.project_type,
+            property_type=contact.property_type,
+            has_insurance=contact.has_insurance
         )
+    
+    def _create_in_browser(self, page: Page, contact: SimpleNamespace) -> Dict:
+        """
+        Run the browser side of project creation (no database access)
+        
+        Args:
+            page: Logged-in page
+            contact: Contact snapshot from _snapshot_contact
+            
+        Returns:
+            Result dict with project_id, error, year_built and screenshot_path
+        """
+        result = {'project_id': None, 'error': None, 'year_built': None, 'screenshot_path': None}
+        
+        try:
+            # Everything the form needs is worked out before the browser is touched
+            payload = self._build_form_payload(contact)
+            
+            # Navigate to project creation
+            if not self._navigate_to_create_project(page):
+                raise Exception("Could not navigate to project creation")
+            
+            # Fill project form
+            result['year_built'] = self._fill_project_form(page, payload)
+            logger.info("Form filled successfully")
+            
+            # Submit and verify
+            project_id = self._submit_and_verify(page, contact)
+            if not project_id:
+                raise Exception("Could not verify project creation")
+            
+            result['project_id'] = project_id
+        
+        except Exception as e:
+            error_details = traceback.format_exc()
+            logger.error(f"Error during browser automation: {e}")
+            logger.error(f"Full traceback:\n{error_details}")
+            result['error'] = str(e)
+            
+            # Take screenshot for debugging; only the capture needs the page,
+            # the file write happens in the background
+            if self.debug_screenshots:
+                try:
+                    screenshot_path = os.path.join(SCREENSHOT_DIR, f"albiware_error_{contact.id}_{int(time.time())}.jpg")
+                    jpeg_bytes = page.screenshot(type='jpeg', quality=60)
+                    _SCREENSHOT_POOL.submit(self._write_screenshot, screenshot_path, jpeg_bytes)
+                    result['screenshot_path'] = screenshot_path
+                except PlaywrightError as screenshot_error:
+                    logger.warning(f"Could not capture screenshot: {screenshot_error}")
+        
+        return result
+    
+    @staticmethod
+    def _write_screenshot(path: str, image_bytes: bytes) -> None:
+        """Write a captured screenshot to disk, keeping only the newest SCREENSHOT_KEEP"""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(image_bytes)
+            logger.info(f"Screenshot saved to {path}")
+            
+            with os.scandir(os.path.dirname(path)) as entries:
+                shots = sorted((e for e in entries if e.is_file()), key=lambda e: e.stat().st_mtime, reverse=True)
+            for old in shots[SCREENSHOT_KEEP:]:
+                try:
+                    os.remove(old.path)
+                except FileNotFoundError:
+                    pass
+        except OSError as e:
+            logger.warning(f"Could not save screenshot to {path}: {e}")
+    
+    def _record_result(
+        self,
+        db: Session,
+        contact: Contact,
+        result: Dict,
+        started_at: datetime,
+        log: Optional[ProjectCreationLog] = None
+    ) -> bool:
+        """
+        Write the creation log and contact updates for a browser result
+        
+        Args:
+            db: Database session (owned by the calling thread)
+            contact: Contact the result belongs to
+            result: Result dict from _create_in_browser
+            started_at: When processing of this contact started
+            log: Pre-inserted pending log to complete; a new one is created if omitted
+            
+        Returns:
+            True if the project was created
+        """
+        project_id = result.get('project_id')
+        if log is None:
+            log = ProjectCreationLog(contact_id=contact.id)
+        log.status = 'success' if project_id else 'failed'
+        log.error_message = result.get('error')
+        log.screenshot_path = result.get('screenshot_path')
+        completed_at = datetime.utcnow()
+        log.started_at = started_at
+        log.completed_at = completed_at
+        # Re-adding is a no-op for a persistent log and re-inserts one
+        # whose pending INSERT was rolled back with an earlier contact
         db.add(log)
-        db.flush()
         
+        if project_id:
+            log.albiware_project_id = project_id
+            contact.project_created = True
+            contact.albiware_project_id = project_id
+            contact.project_created_at = completed_at
+        
+        # Check if asbestos testing is required (pre-1988 properties)
+        year_built = result.get('year_built')
+        if year_built and year_built < 1988 and not contact.asbestos_testing_required:
+            logger.info(f"Property built in {year_built} (pre-1988) - Asbestos testing required")
+            self._send_asbestos_notification(contact, year_built)
+        
+        # Single commit per contact: the project already exists in Albiware,
+        # so its record must not wait on other contacts in the batch
+        db.commit()
+        
+        if project_id:
+            logger.info(f"Successfully created project {project_id} for {contact.full_name}")
+            return True
+        return False
+    
+    def _load_storage_state(self) -> Optional[Dict]:
+        """Load a previously saved login session, if there is one"""
+        if not self._login_state_path or not os.path.exists(self._login_state_path):
+            return None
+        try:
+            if time.time() - os.path.getmtime(self._login_state_path) > LOGIN_STATE_MAX_AGE:
+                logger.info("Saved login state is stale, logging in fresh")
+                return None
+            with open(self._login_state_path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable login state {self._login_state_path}: {e}")
+            return None
+    
+    def _save_storage_state(self, state: Dict) -> None:
+        """
+        Write the login session file atomically
+        
+        Written to a temp file and renamed into place, so a crash mid-write
+        or a concurrent read never sees half a JSON document.
+        """
+        if not self._login_state_path:
+            return
+        tmp_path = f"{self._login_state_path}.{os.getpid()}.tmp"
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context()
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self._login_state_path)
+        except OSError as e:
+            logger.warning(f"Could not save login state to {self._login_state_path}: {e}")
+    
+    def _forget_login_state(self) -> None:
+        """Delete the saved login session file"""
+        if not self._login_state_path:
+            return
+        try:
+            os.remove(self._login_state_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove login state {self._login_state_path}: {e}")
+    
+    def _ensure_browser(self) -> Browser:
+        """
+        Return this worker thread's browser, launching it on first use
+        
+        The browser is relaunched after serving _max_uses contacts so a
+        long-lived Chromium doesn't accumulate memory.
+        """
+        local = self._local
+        if getattr(local, 'browser', None) is not None:
+            if local.uses >= self._max_uses:
+                logger.info(f"Recycling browser after {local.uses} contacts")
+                self._close_browser()
+            elif not local.browser.is_connected():
+                logger.warning("Browser disconnected, relaunching")
+                self._close_browser()
+        
+        if getattr(local, 'browser', None) is None:
+            local.playwright = sync_playwright().start()
+            if self.cdp_endpoint:
+                # Shared Chromium; close() later only disconnects from it
+                local.browser = local.playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+            else:
+                # Playwright 1.40's headless=True already runs the lightweight headless shell
+                local.browser = local.playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+            local.uses = 0
+        
+        local.uses += 1
+        return local.browser
+    
+    def _close_browser(self) -> None:
+        """Close this worker thread's browser and Playwright driver, if running"""
+        self._discard_page()
+        local = self._local
+        browser, playwright = getattr(local, 'browser', None), getattr(local, 'playwright', None)
+        local.browser = local.playwright = None
+        try:
+            if browser is not None:
+                browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser: {e}")
+        finally:
+            if playwright is not None:
+                playwright.stop()
+    
+    def _worker_page(self) -> Page:
+        """
+        Return this worker's logged-in page, opening a context on first use
+        
+        The page is kept across contacts: each contact starts with a direct
+        goto to /Project/New, and reusing the context keeps Albiware's
+        scripts in its HTTP cache instead of refetching them per contact.
+        """
+        browser = self._ensure_browser()
+        local = self._local
+        if getattr(local, 'page', None) is not None:
+            if self._healthy(local.page):
+                return local.page
+            logger.warning("Browser failed health check, relaunching")
+            self._close_browser()
+            browser = self._ensure_browser()
+        
+        # Only the first worker logs in; the rest start from its saved session.
+        # A stale session is caught by the /Login redirect check on navigation.
+        with self._login_lock:
+            context = browser.new_context(storage_state=self._storage_state)
+            try:
+                context.add_init_script(FORM_HELPERS_JS)
+                context.route("**/*", self._route_request)
+                context.on("request", self._on_request)
+                context.on("response", self._on_response)
                 page = context.new_page()
                 
-                try:
-                    # Login
-                    login_result = self._login(page)
-                    if not login_result:
-                        page_url = page.url
-                        page_title = page.title()
-                        raise Exception(f"Could not log in to Albiware. Current URL: {page_url}, Title: {page_title}")
-                    
-                    # Navigate to project creation
-                    if not self._navigate_to_create_project(page):
-                        raise Exception("Could not navigate to project creation")
-                    
-                    # Fill project form
-                    self._fill_project_form(page, contact)
-                    logger.info("Form filled successfully")
-                    
-                    # Submit and verify
-                    project_id = self._submit_and_verify(page, contact)
-                    
-                    if project_id:
-                        # Success!
-                        log.status = 'success'
-                        log.albiware_project_id = project_id
-                        log.completed_at = datetime.utcnow()
-                        
-                        contact.project_created = True
-                        contact.albiware_project_id = project_id
-                        contact.project_created_at = datetime.utcnow()
-                        
-                        db.commit()
-                        logger.info(f"Successfully created project {project_id} for {contact.full_name}")
-                        return True
-                    else:
-                        raise Exception("Could not verify project creation")
-                
-                except Exception as e:
-                    import traceback
-                    error_details = traceback.format_exc()
-                    logger.error(f"Error during browser automation: {e}")
-                    logger.error(f"Full traceback:\n{error_details}")
-                    
-                    # Take screenshot for debugging
-                    try:
-                        screenshot_path = f"/tmp/albiware_error_{int(time.time())}.png"
-                        page.screenshot(path=screenshot_path)
-                        logger.info(f"Screenshot saved to {screenshot_path}")
-                    except:
-                        pass
-                    
-                    log.status = 'failed'
-                    log.error_message = str(e)
-                    log.completed_at = datetime.utcnow()
-                    db.commit()
-                    
-                    return False
-                
-                finally:
-                    browser.close()
+                if self._storage_state is None and not self._login(page):
+                    raise Exception(f"Could not log in to Albiware. Current URL: {page.url}, Title: {page.title()}")
+            except Exception:
+                context.close()
+                raise
+            # The session this context holds, so an expired-session refresh can
+            # tell whether another worker has already replaced it
+            login_state = self._storage_state
         
-        except Exception as e:
-            logger.error(f"Playwright initialization error: {e}")
-            log.status = 'failed'
-            log.error_message = str(e)
-            log.completed_at = datetime.utcnow()
-            db.commit()
+        local.context, local.page, local.login_state = context, page, login_state
+        return page
+    
+    @staticmethod
+    def _healthy(page: Page) -> bool:
+        """Cheap round trip to make sure the page's renderer still responds"""
+        try:
+            return page.evaluate("1 + 1") == 2
+        except PlaywrightError:
             return False
     
+    def _discard_page(self) -> None:
+        """Close this worker's context so the next contact starts clean"""
+        local = self._local
+        context = getattr(local, 'context', None)
+        local.context = local.page = local.login_state = None
+        if context is not None:
+            try:
+                context.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser context: {e}")
+    
+    def _on_request(self, request) -> None:
+        """
+        Log the field names of the first create-project form POST
+        
+        Groundwork for replacing the browser flow with a direct HTTP POST:
+        shows which fields the endpoint expects without logging any values.
+        """
+        if self._form_post_logged or request.method != "POST":
+            return
+        if urlparse(request.url).path.rstrip('/') != "/Project/New":
+            return
+        self._form_post_logged = True
+        fields = sorted(parse_qs(request.post_data or "", keep_blank_values=True))
+        logger.info(f"Create-project POST {request.url} fields: {', '.join(fields)}")
+    
+    def _on_response(self, response) -> None:
+        """Back off the shared rate limit when Albiware starts throttling"""
+        # Third-party 429s say nothing about Albiware's limits
+        if response.status == 429 and (urlparse(response.url).hostname or "").endswith("albiware.com"):
+            self._bucket.penalize()
+    
+    def _route_request(self, route) -> None:
+        """
+        Trim what pages load: abort images/fonts/media, stub out analytics and
+        serve repeat dropdown lookups from memory
+        """
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        elif (urlparse(request.url).hostname or "").endswith(BLOCKED_HOSTS):
+            # An empty success instead of a network error, so tracker
+            # libraries don't queue retries of their beacons
+            route.fulfill(status=204, body="")
+        elif (
+            request.method == "GET"
+            and request.resource_type in ("xhr", "fetch")
+            and LOOKUP_URL_RE.search(urlparse(request.url).path)
+        ):
+            self._serve_lookup(route)
+        else:
+            route.continue_()
+    
+    def _serve_lookup(self, route) -> None:
+        """Fulfill a dropdown lookup from the shared cache, fetching and caching it on a miss"""
+        key = self._lookup_key(route.request.url)
+        now = time.monotonic()
+        with self._lookup_lock:
+            cached = self._lookup_cache.get(key)
+        if cached and cached[0] > now:
+            _, status, content_type, body = cached
+            route.fulfill(status=status, content_type=content_type, body=body)
+            return
+        
+        response = route.fetch()
+        body = response.body()
+        if response.ok:
+            # Only what the dropdown needs is replayed: the original headers would
+            # carry Set-Cookie into other contexts, and Content-Length/-Encoding
+            # that no longer match the already-decoded body
+            with self._lookup_lock:
+                self._lookup_cache[key] = (
+                    now + LOOKUP_CACHE_TTL, response.status, response.headers.get('content-type'), body
+                )
+        # Without a body override Playwright replays the fetched response as-is,
+        # and its Set-Cookie only reaches the context that made the request
+        route.fulfill(response=response)
+    
+    @staticmethod
+    def _lookup_key(url: str) -> str:
+        """Cache key for a lookup URL: jQuery's '_' cache-buster dropped, params sorted"""
+        parts = urlparse(url)
+        params = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != '_')
+        return parts._replace(query=urlencode(params), fragment='').geturl()
+    
     def _login(self, page: Page) -> bool:
         """Login to Albiware"""
         try:
             logger.info("Logging in to Albiware...")
-            page.goto(f"{self.albiware_url}/Login", wait_until="domcontentloaded", timeout=30000)
-            
-            # Wait for login form
-            page.wait_for_selector('input#Email', timeout=15000)
+            page.goto(f"{self.albiware_url}/Login", wait_until="commit", timeout=30000)
             
-            # Fill login form
-            page.fill('input#Email', self.email)
-            page.fill('input#password', self.password)
+            # Fill login form (fill auto-waits for the form to render)
+            page.locator('input#Email').fill(self.email, timeout=15000)
+            page.locator('input#password').fill(self.password)
             
             # Click login button
-            page.click('button[type="submit"]')
+            page.locator('button[type="submit"]').click()
             
             # Wait for redirect to dashboard
-            page.wait_for_url("**/TaskDashboard", timeout=30000)
+            # The session cookie arrives with the redirect, so there is no need
+            # to wait for the dashboard itself to load
+            page.wait_for_url("**/TaskDashboard", wait_until="commit", timeout=30000)
             logger.info("Login successful")
             
+            # Save the session so other contexts (and later runs) can skip the login flow
+            self._storage_state = page.context.storage_state()
+            self._save_storage_state(self._storage_state)
+            
             return True
             
         except Exception as e:
             logger.error(f"Login error: {e}")
             return False
     
+    def _refresh_login_if_expired(self, page: Page, target_url: str) -> bool:
+        """
+        Log in again if the saved session was rejected (redirect to /Login)
+        
+        Args:
+            page: Page that just navigated
+            target_url: URL to return to after logging in
+            
+        Returns:
+            False if re-login failed
+        """
+        if "/Login" not in page.url:
+            return True
+        
+        local = self._local
+        # Workers usually hit the expiry together; only the first one logs in
+        with self._login_lock:
+            state = self._storage_state
+            if state is not None and state is not getattr(local, 'login_state', None):
+                logger.info("Albiware session expired, reusing the session another worker refreshed")
+                page.context.add_cookies(state['cookies'])
+            else:
+                logger.info("Albiware session expired, logging in again...")
+                # Don't let a restart (or a new worker context) pick the
+                # rejected session back up if this login fails
+                self._storage_state = None
+                self._forget_login_state()
+                if not self._login(page):
+                    return False
+            local.login_state = self._storage_state
+        
+        page.goto(target_url, wait_until="commit", timeout=30000)
+        return True
+    
     def _navigate_to_create_project(self, page: Page) -> bool:
         """Navigate to the project creation page"""
         try:
             logger.info("Navigating to project creation...")
-            page.goto(f"{self.albiware_url}/Project/New", wait_until="domcontentloaded", timeout=30000)
+            # Readiness is gated on the form widgets below, not on page load events
+            page.goto(f"{self.albiware_url}/Project/New", wait_until="commit", timeout=30000)
+            
+            if not self._refresh_login_if_expired(page, f"{self.albiware_url}/Project/New"):
+                return False
+            
             logger.info(f"Loaded URL: {page.url}")
-            logger.info(f"Page title: {page.title()}")
             
             # Wait for form to load
             page.wait_for_selector('select#CustomerOption', timeout=15000)
-            logger.info("Project creation form loaded")
+            logger.info(f"Project creation form loaded ({page.title()})")
             
             # Wait for page to fully initialize (jQuery, Kendo widgets, etc.)
-            time.sleep(3)
+            page.wait_for_function(KENDO_READY_JS, timeout=15000)
             
             return True
             
@@ -177,159 +745,125 @@ class AlbiwareProjectCreator:
             logger.error(traceback.format_exc())
             return False
     
-    def _fill_project_form(self, page: Page, contact: Contact) -> bool:
+    def _build_form_payload(self, contact: SimpleNamespace) -> Dict:
+        """
+        Resolve every form value for a contact, applying the defaults
+        
+        Args:
+            contact: Contact snapshot from _snapshot_contact
+            
+        Returns:
+            Field values for _fill_project_form
+        """
+        project_type = contact.project_type or "Emergency Mitigation Services"
+        has_insurance = bool(contact.has_insurance)
+        return {
+            'customer_name': contact.full_name,
+            'project_type_keyword': PROJECT_TYPE_KEYWORDS.get(project_type, 'Emergency'),
+            'property_type': contact.property_type or "Residential",
+            'has_insurance': has_insurance,
+            'covered_loss': str(has_insurance),
+            'address': contact.address,
+        }
+    
+    def _fill_project_form(self, page: Page, payload: Dict) -> Optional[int]:
         """
         Fill out the project creation form
         
         CRITICAL FIX: Uses keyboard navigation and Enter key to properly select
         dropdown options instead of just setting values via jQuery
+        
+        Args:
+            page: Page on /Project/New
+            payload: Field values from _build_form_payload
+            
+        Returns:
+            Year built from the property lookup, if found
         """
         try:
-            logger.info(f"Filling project form for {contact.full_name}...")
-            time.sleep(3)  # Wait for page initialization
-            
-            # STEP 1: Customer Option - Select "Add Existing"
-            logger.info("STEP 1: Customer Option...")
-            page.select_option('#CustomerOption', label='Add Existing')
-            time.sleep(2)
+            logger.info(f"Filling project form for {payload['customer_name']}...")
+            locs = self._locators(page)
+            
+            # STEP 1: Customer Option and Referrer Option - "Add Existing", in one call
+            logger.debug("STEP 1: Customer Option, Referrer Option...")
+            missing = page.evaluate(SET_SELECTS_JS, [
+                [FORM_SELECTORS['customer_option'], 'Add Existing', True],
+                [FORM_SELECTORS['referrer_option'], 'Add Existing', True],
+            ])
+            if missing:
+                raise Exception(f"Selection failed - no matching option for {', '.join(missing)}")
+            locs['customer_dropdown'].wait_for(state='visible', timeout=10000)
             logger.info("✓ Set to Add Existing")
             
             # STEP 2: Select Customer - CRITICAL FIX
             # Must click dropdown, type name, and press Enter to properly select
-            logger.info(f"STEP 2: Selecting customer {contact.full_name}...")
-            
-            # Click on the customer dropdown to open it
-            page.click('span[role="listbox"]:has-text("Choose One")')
-            time.sleep(1)
-            
-            # Type the customer name in the search box
-            search_input = page.locator('#ExistingOrganizationId-list input[role="listbox"]')
-            search_input.fill(contact.full_name)
-            time.sleep(1)
-            
-            # Press Arrow Down to highlight the first result
-            page.keyboard.press('ArrowDown')
-            time.sleep(0.5)
-            
-            # Press Enter to select
-            page.keyboard.press('Enter')
-            time.sleep(2)
-            
-            # Verify the customer was selected
-            result = page.evaluate("""
-                (function() {
-                    var value = $('#ExistingOrganizationId').val();
-                    return {value: value, success: !!value};
-                })()
-            """)
-            if not result.get('success'):
-                raise Exception(f"Customer selection failed - ExistingOrganizationId is empty")
-            logger.info(f"✓ Customer selected (ID: {result.get('value')})")
+            logger.debug(f"STEP 2: Selecting customer {payload['customer_name']}...")
             
-            # STEP 2: Referrer Option - Add Existing
-            logger.info("STEP 2: Referrer Option...")
-            page.select_option('#ReferrerOption', label='Add Existing')
-            time.sleep(2)  # Wait for Referral Sources field to appear
-            logger.info("✓ Referrer Option set")
+            if not self._pick_search_result(
+                page, locs['customer_dropdown'], locs['customer_search'],
+                'ExistingOrganizationId', payload['customer_name'], FIELD_HAS_VALUE_JS
+            ):
+                raise Exception(f"Customer selection failed - ExistingOrganizationId is empty")
+            logger.info("✓ Customer selected")
             
             # STEP 2.5: Referral Sources - Select2 dropdown (same method as Customer)
-            logger.info("STEP 2.5: Referral Sources...")
+            logger.debug("STEP 2.5: Referral Sources...")
             
-            # Click on the Referral Sources dropdown to open it
             # The field ID is ExistingReferralSourceId (not ProjectReferrer_ReferralSourceId)
-            page.click('span[aria-owns="ExistingReferralSourceId_listbox"]')
-            time.sleep(1)
-            
-            # Type "Plumber" in the search box
-            search_input = page.locator('#ExistingReferralSourceId-list input[role="listbox"]')
-            search_input.fill('Plumber')
-            time.sleep(1)
-            
-            # Press Arrow Down to highlight the first result
-            page.keyboard.press('ArrowDown')
-            time.sleep(0.5)
-            
-            # Press Enter to select
-            page.keyboard.press('Enter')
-            time.sleep(2)
-            
-            # Verify the selection
-            result = page.evaluate("""
-                (function() {
-                    var value = $('#ExistingReferralSourceId').val();
-                    return {value: value, success: !!value};
-                })()
-            """)
-            if not result.get('success'):
+            # (the dropdown click auto-waits for the field to appear after Referrer Option)
+            if not self._pick_search_result(
+                page, locs['referral_dropdown'], locs['referral_search'],
+                'ExistingReferralSourceId', 'Plumber', FIELD_HAS_VALUE_JS
+            ):
                 raise Exception(f"Referral Sources selection failed - value is empty")
-            logger.info(f"✓ Referral Sources selected: Plumber (ID: {result.get('value')})")
+            logger.info("✓ Referral Sources selected: Plumber")
             
             # STEP 3: Project Type - UI interaction method
-            logger.info("STEP 3: Project Type...")
-            
-            # Get project type from contact, default to EMS
-            project_type = contact.project_type if contact.project_type else "Emergency Mitigation Services"
-            
-            # Map project type names to search keywords for Albiware dropdown
-            project_type_keywords = {
-                'Emergency Mitigation Services': 'Emergency',
-                'Mold': 'Mold',
-                'Reconstruction': 'Reconstruction',
-                'Sewage': 'Sewage',
-                'Biohazard': 'Biohazard',
-                'Contents': 'Contents',
-                'Vandalism': 'Vandalism'
-            }
-            
-            search_keyword = project_type_keywords.get(project_type, 'Emergency')
-            
-            # Click on the Project Type dropdown to open it
-            page.click('span[aria-owns="ProjectTypeId_listbox"]')
-            time.sleep(1)
-            
-            # Type the search keyword in the search box
-            search_input = page.locator('input[role="listbox"]').first
-            search_input.fill(search_keyword)
-            time.sleep(1)
-            
-            # Press Arrow Down to highlight the first result
-            page.keyboard.press('ArrowDown')
-            time.sleep(0.5)
-            
-            # Press Enter to select
-            page.keyboard.press('Enter')
-            time.sleep(2)
-            
-            # Verify the selection
-            result = page.evaluate("""
-                (function() {
-                    var widget = $('#ProjectTypeId').data('kendoDropDownList');
-                    if (!widget) return {success: false, error: 'Widget not found'};
-                    var value = widget.value();
-                    var text = widget.text();
-                    return {success: !!value, value: value, text: text};
-                })()
-            """)
-            if not result.get('success'):
-                raise Exception(f"Project Type selection failed")
-            logger.info(f"✓ Project Type set to: {result.get('text')}")
-            
-            # STEP 4: Property Type
-            logger.info("STEP 4: Property Type...")
-            prop_type = contact.property_type if contact.property_type else "Residential"
-            page.select_option('#PropertyType', value=prop_type.lower())
-            time.sleep(1)
-            logger.info(f"✓ Property Type: {prop_type}")
-            
-            # STEP 4.5: Year Built - Lookup from property API
-            logger.info("STEP 4.5: Year Built (property API lookup)...")
+            logger.debug("STEP 3: Project Type...")
+            
+            search_keyword = payload['project_type_keyword']
+            
+            # Skip the dropdown entirely if the form already has a matching type
+            result = page.evaluate(KENDO_SELECTION_JS, 'ProjectTypeId')
+            if result.get('success') and search_keyword.lower() in (result.get('text') or '').lower():
+                logger.info(f"✓ Project Type already set to: {result.get('text')}")
+            else:
+                self._pick_search_result(
+                    page, locs['project_type_dropdown'], locs['project_type_search'].first,
+                    'ProjectTypeId', search_keyword, KENDO_HAS_VALUE_JS
+                )
+                
+                # Verify the selection
+                result = page.evaluate(KENDO_SELECTION_JS, 'ProjectTypeId')
+                if not result.get('success'):
+                    raise Exception(f"Project Type selection failed")
+                logger.info(f"✓ Project Type set to: {result.get('text')}")
+            
+            # STEP 4: Staff - Rodolfo Arceo
+            logger.debug("STEP 4: Staff...")
+            locs['staff'].select_option(label='Rodolfo Arceo')
+            # Wait for Project Role options to load
+            self._wait_for_js(page, SELECT_HAS_OPTIONS_JS, FORM_SELECTORS['project_role'])
+            logger.info("✓ Staff set to Rodolfo Arceo")
+            
+            # STEP 5: Property Type, Project Role (Estimator) and Insurance Info in one call
+            # Insurance Info goes LAST TO PREVENT JAVASCRIPT FROM OVERWRITING IT
+            logger.debug("STEP 5: Property Type, Project Role, Insurance Info...")
+            missing = page.evaluate(SET_SELECTS_JS, [
+                [FORM_SELECTORS['property_type'], payload['property_type'].lower(), False],
+                [FORM_SELECTORS['project_role'], 'Estimator', True],
+                [FORM_SELECTORS['covered_loss'], payload['covered_loss'], False],
+            ])
+            if missing:
+                raise Exception(f"Selection failed - no matching option for {', '.join(missing)}")
+            logger.info(f"✓ Property Type: {payload['property_type']}, Project Role: Estimator")
+            
+            # STEP 5.5: Year Built - Lookup from property API
+            logger.debug("STEP 5.5: Year Built (property API lookup)...")
             year_built = None
             
-            # Get customer address from Albiware contact
-            # Assuming contact has address fields - adjust based on actual schema
-            if hasattr(contact, 'address') and contact.address:
-                # Format address for API lookup
-                address_str = contact.address
+            if payload['address']:
+                address_str = payload['address']
                 logger.info(f"Looking up year built for address: {address_str}")
                 
                 # Call property API
@@ -339,61 +873,26 @@ class AlbiwareProjectCreator:
                     # Fill the Year Built field if it exists
                     try:
                         # Check if Year Built field exists on the page
-                        year_built_field = page.locator('#YearBuilt, input[name="YearBuilt"]').first
+                        year_built_field = locs['year_built'].first
                         if year_built_field.is_visible():
-                            year_built_field.fill(str(year_built))
-                            time.sleep(1)
+                            self._fill_if_changed(year_built_field, str(year_built))
                             logger.info(f"✓ Year Built: {year_built}")
                         else:
                             logger.info("Year Built field not found on page (may not be required)")
                     except Exception as e:
                         logger.warning(f"Could not fill Year Built field: {e}")
-                    
-                    # Check if asbestos testing is required (pre-1988 properties)
-                    if year_built < 1988:
-                        logger.info(f"Property built in {year_built} (pre-1988) - Asbestos testing required")
-                        self._send_asbestos_notification(db, contact, year_built)
                 else:
                     logger.info("Year Built not found via property API (feature may be disabled)")
             else:
                 logger.info("No address available for property lookup")
             
-            # STEP 5: Staff - Rodolfo Arceo
-            logger.info("STEP 5: Staff...")
-            page.select_option('#StaffId', label='Rodolfo Arceo')
-            time.sleep(2)  # Wait for Project Role options to load
-            logger.info("✓ Staff set to Rodolfo Arceo")
-            
-            # STEP 9: Project Role - Estimator - CRITICAL FIX
-            # Field is #ProjectRoleId (singular, not plural!)
-            logger.info("STEP 9: Project Role...")
-            page.select_option('#ProjectRoleId', label='Estimator')
-            time.sleep(1)
-            
-            # Verify
-            result = page.evaluate("""
-                (function() {
-                    var value = $('#ProjectRoleId').val();
-                    return {value: value, success: !!value};
-                })()
-            """)
-            if not result.get('success'):
-                raise Exception(f"Project Role selection failed")
-            logger.info(f"✓ Project Role set to Estimator (ID: {result.get('value')})")
-            
-            # STEP 6: Insurance Info - SET THIS LAST TO PREVENT JAVASCRIPT FROM OVERWRITING IT
-            logger.info("STEP 6: Insurance Info (setting last to prevent override)...")
-            has_ins = contact.has_insurance if contact.has_insurance is not None else False
-            logger.info(f"DEBUG: contact.has_insurance = {contact.has_insurance}, has_ins = {has_ins}, str(has_ins) = {str(has_ins)}")
-            page.select_option('#CoveredLoss', value=str(has_ins))
-            time.sleep(1)
-            logger.info(f"✓ Insurance Info: {'Yes' if has_ins else 'No'}")
-            
-            # Wait for all events to propagate
-            time.sleep(2)
+            # STEP 6: Make sure change handlers did not overwrite Insurance Info
+            if not self._wait_for_js(page, SELECT_VALUE_IS_JS, [FORM_SELECTORS['covered_loss'], payload['covered_loss']]):
+                raise Exception("Insurance Info selection was overwritten")
+            logger.info(f"✓ Insurance Info: {'Yes' if payload['has_insurance'] else 'No'}")
             
             logger.info("✅ Form filling complete!")
-            return True
+            return year_built
             
         except Exception as e:
             logger.error(f"Form filling error: {str(e)}")
@@ -401,81 +900,158 @@ class AlbiwareProjectCreator:
             logger.error(traceback.format_exc())
             raise
     
-    def _submit_and_verify(self, page: Page, contact: Contact) -> Optional[str]:
+    def _locators(self, page: Page) -> Dict[str, Locator]:
+        """
+        Bind FORM_SELECTORS to a page, once per page
+        
+        Worker pages are reused across contacts, so the bound locators are
+        kept alongside them. Locators re-resolve on every action, so they
+        never go stale the way cached ElementHandles would.
+        """
+        local = self._local
+        if getattr(local, 'locators_page', None) is not page:
+            local.locators = {name: page.locator(selector) for name, selector in FORM_SELECTORS.items()}
+            local.locators_page = page
+        return local.locators
+    
+    def _fill_if_changed(self, locator: Locator, value: str) -> bool:
+        """Fill a text input only if it does not already hold the value; True if it was written"""
+        if locator.input_value() == value:
+            return False
+        locator.fill(value)
+        return True
+    
+    def _pick_search_result(
+        self,
+        page: Page,
+        dropdown: Locator,
+        search: Locator,
+        field_id: str,
+        text: str,
+        selected_js: str
+    ) -> bool:
+        """
+        Pick the first search match in a Kendo dropdown the way a user would
+        
+        Albiware only registers the choice when it is typed into the search box
+        and confirmed with ArrowDown + Enter; setting the value via jQuery is ignored.
+        
+        Args:
+            page: Page with the form
+            dropdown: Element that opens the dropdown
+            search: The dropdown's search box
+            field_id: ID of the underlying field (its list is #{field_id}-list)
+            text: Search text
+            selected_js: Predicate taking field_id that is true once a value is selected
+            
+        Returns:
+            True once the field reports a selected value
+        """
+        dropdown.click()
+        search.fill(text)
+        self._wait_for_list_item(page, f'#{field_id}-list', text)
+        page.keyboard.press('ArrowDown')
+        page.keyboard.press('Enter')
+        return self._wait_for_js(page, selected_js, field_id)
+    
+    def _wait_for_list_item(self, page: Page, list_selector: str, text: str, timeout: int = 10000) -> bool:
+        """Wait until a Kendo dropdown list shows an item matching the search text"""
+        try:
+            page.locator(f'{list_selector} li').filter(has_text=text).first.wait_for(state='visible', timeout=timeout)
+            return True
+        except PlaywrightTimeout:
+            logger.warning(f"No '{text}' item appeared in {list_selector}")
+            return False
+    
+    def _wait_for_js(self, page: Page, expression: str, arg=None, timeout: int = 10000) -> bool:
+        """Wait until a JS predicate is truthy; False on timeout so callers can verify and report"""
+        try:
+            page.wait_for_function(expression, arg=arg, timeout=timeout)
+            return True
+        except PlaywrightTimeout:
+            return False
+    
+    def _submit_and_verify(self, page: Page, contact: SimpleNamespace) -> Optional[str]:
         """Submit the form and verify project creation"""
+        locs = self._locators(page)
         try:
             logger.info("Submitting form...")
             
-            # Check for any validation errors BEFORE submission
-            try:
-                errors_before = page.locator('.field-validation-error, .validation-summary-errors').all_text_contents()
-                if errors_before:
-                    logger.error(f"Validation errors BEFORE submit: {errors_before}")
-                    return None
-            except:
-                pass
-            
             # Click the Create button
             logger.info("Clicking Create button...")
-            page.click('input#SubmitButton[type="submit"]')
+            locs['submit'].click()
             logger.info("Create button clicked, waiting for response...")
             
-            # Wait a moment for the page to process
-            time.sleep(3)
-            
-            # Check current URL immediately after click
-            current_url_after_click = page.url
-            logger.info(f"URL after clicking Create: {current_url_after_click}")
-            
-            # Check for validation errors AFTER submission
-            try:
-                errors_after = page.locator('.field-validation-error, .validation-summary-errors').all_text_contents()
-                if errors_after:
-                    logger.error(f"Validation errors AFTER submit: {errors_after}")
-                    return None
-            except:
-                pass
-            
             # Wait for redirect to project page with numeric ID
             # URL pattern: https://app.albiware.com/Project/{project_id}
-            # Must NOT match /Project/New
             logger.info("Waiting for redirect to project page...")
-            page.wait_for_url(lambda url: "/Project/" in url and "/Project/New" not in url, timeout=30000)
-            
-            # Extract project ID from URL
-            current_url = page.url
-            logger.info(f"Redirected to: {current_url}")
-            
-            # Parse project ID from URL
-            if "/Project/" in current_url:
-                parts = current_url.split("/Project/")
-                if len(parts) > 1:
-                    project_id = parts[1].split("?")[0].split("#")[0]
-                    logger.info(f"✅ Project created successfully! ID: {project_id}")
-                    return project_id
-            
-            raise Exception(f"Could not extract project ID from URL: {current_url}")
+            project_id = self._wait_for_project_id(page, locs)
+            if project_id:
+                logger.info(f"Redirected to: {page.url}")
+                logger.info(f"✅ Project created successfully! ID: {project_id}")
+            return project_id
             
         except Exception as e:
             logger.error(f"Submit/verify error: {e}")
             logger.error(f"Current URL: {page.url}")
             
-            # Check for validation errors
+            # Check for validation errors and dump what the form held
             try:
-                errors = page.locator('.field-validation-error, .validation-summary-errors').all_text_contents()
+                errors = locs['validation_errors'].all_text_contents()
                 if errors:
                     logger.error(f"Validation errors: {errors}")
-            except:
+                logger.error(f"Form state: {page.evaluate(FORM_STATE_JS)}")
+            except PlaywrightError:
                 pass
             
             return None
     
-    def _send_asbestos_notification(self, db: Session, contact: Contact, year_built: int) -> None:
+    def _wait_for_project_id(self, page: Page, locs: Dict[str, Locator], timeout: float = 30.0) -> Optional[str]:
+        """
+        Wait for the post-submit redirect, checking for validation errors in between
+        
+        Each window waits on the redirect itself, so it is seen as soon as the
+        navigation commits. Windows grow from 100ms to a second; between them
+        the form is checked for validation errors so a rejected submit stops
+        early instead of running out the full timeout.
+        
+        Returns:
+            Project ID from the URL, or None if the form was rejected
+            
+        Raises:
+            Exception: If neither a redirect nor validation errors appear in time
+        """
+        deadline = time.monotonic() + timeout
+        interval = 0.1
+        while True:
+            # Wait first: a redirect inside the window skips the error scan entirely
+            try:
+                page.wait_for_url(PROJECT_URL_RE, wait_until="commit", timeout=interval * 1000)
+            except PlaywrightTimeout:
+                interval = min(interval * 1.5, 1.0)
+            
+            match = PROJECT_URL_RE.search(page.url)
+            if match:
+                return match.group(1)
+            
+            try:
+                errors = locs['validation_errors'].all_text_contents()
+            except PlaywrightError:
+                errors = []  # Page is mid-navigation
+            if errors:
+                logger.error(f"Validation errors AFTER submit: {errors}")
+                return None
+            
+            if time.monotonic() >= deadline:
+                raise Exception(f"Timed out waiting for project page. Current URL: {page.url}")
+    
+    def _send_asbestos_notification(self, contact: Contact, year_built: int) -> None:
         """
         Send SMS notification to technician about asbestos testing requirement
         
+        Marks the contact but leaves committing to the caller.
+        
         Args:
-            db: Database session
             contact: Contact object
             year_built: Year the property was built
         """
@@ -521,7 +1097,6 @@ class AlbiwareProjectCreator:
             # Store notification in database for tracking
             contact.asbestos_testing_required = True
             contact.asbestos_notification_sent_at = datetime.utcnow()
-            db.commit()
             
         except Exception as e:
             logger.error(f"Failed to send asbestos notification: {e}")
@@ -538,30 +1113,200 @@ class AlbiwareProjectCreator:
         
         # Query contacts that need project creation
         contacts = db.query(Contact).filter(
-            Contact.project_creation_needed == True,
-            Contact.project_created == False
+            Contact.project_creation_needed.is_(True),
+            Contact.project_created.is_(False)
         ).all()
         
         logger.info(f"Query returned {len(contacts)} contacts needing project creation")
-        if contacts:
-            for c in contacts:
-                logger.info(f"  - Contact {c.id}: {c.full_name}, project_creation_needed={c.project_creation_needed}, project_created={c.project_created}")
-        else:
+        if not contacts:
             logger.warning("No contacts found matching criteria!")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Pending contacts: {[c.id for c in contacts]}")
         
-        projects_created = 0
-        for contact in contacts:
-            try:
-                logger.info(f"Processing contact: {contact.full_name} (ID: {contact.id})")
-                success = self.create_project_for_contact(db, contact)
-                if success:
-                    projects_created += 1
-                    logger.info(f"✅ Successfully created project for {contact.full_name}")
-                else:
-                    logger.error(f"❌ Failed to create project for {contact.full_name}")
-            except Exception as e:
-                logger.error(f"Error processing contact {contact.id}: {e}")
-                continue
+        projects_created = self.create_projects_for_contacts(db, contacts)
         
         logger.info(f"Project creation complete. Created {projects_created} projects.")
         return projects_created
+    
+    def create_projects_for_contacts(self, db: Session, contacts: List[Contact]) -> int:
+        """
+        Create projects for a batch of contacts, max_workers browsers at a time
+        
+        Args:
+            db: Database session (owned by the calling thread)
+            contacts: Contacts to create projects for
+            
+        Returns:
+            Number of projects created
+        """
+        projects_created = 0
+        if not contacts:
+            return projects_created
+        
+        # Pending logs for the whole batch go out as one multi-row INSERT;
+        # each is completed in place when its contact finishes
+        batch_started_at = datetime.utcnow()
+        logs = {
+            contact.id: ProjectCreationLog(contact_id=contact.id, status='pending', started_at=batch_started_at)
+            for contact in contacts
+        }
+        db.add_all(logs.values())
+        db.flush()
+        
+        # Browser work fans out to workers; every database write stays on this thread.
+        # Each contact commits on its own, so keep the batch's objects loaded across commits.
+        with no_expire_on_commit(db):
+            for contact, started_at, result in self._run_batch(contacts):
+                try:
+                    if self._record_result(db, contact, result, started_at, logs[contact.id]):
+                        projects_created += 1
+                        logger.info(f"✅ Successfully created project for {contact.full_name}")
+                    else:
+                        logger.error(f"❌ Failed to create project for {contact.full_name}")
+                except Exception as e:
+                    logger.error(f"Error processing contact {contact.id}: {e}")
+                    db.rollback()
+        
+        return projects_created
+    
+    def _run_batch(self, contacts: List[Contact]) -> Iterator[Tuple[Contact, datetime, Dict]]:
+        """
+        Queue contacts on the browser workers and yield results as they finish
+        
+        Args:
+            contacts: Contacts to create projects for
+            
+        Yields:
+            (contact, started_at, result) on the calling thread, in completion order
+        """
+        pending = {contact.id: contact for contact in contacts}
+        results = queue.Queue()
+        
+        with self:
+            for contact in contacts:
+                self._work.put((self._snapshot_contact(contact), results))
+            
+            for _ in range(len(contacts)):
+                snapshot, started_at, result = results.get()
+                yield pending.pop(snapshot.id), started_at, result
+    
+    def _browser_worker(self) -> None:
+        """
+        Worker thread loop: create projects from the work queue until told to stop
+        
+        Every queued contact gets exactly one result, even if the browser
+        could not be started.
+        """
+        try:
+            while True:
+                item = self._work.get()
+                if item is None:
+                    break
+                
+                # Stamped when a worker picks the contact up, not when it was queued
+                snapshot, results = item
+                started_at = datetime.utcnow()
+                started = time.monotonic()
+                logger.info(f"Processing contact: {snapshot.full_name} (ID: {snapshot.id})")
+                try:
+                    self._bucket.acquire()
+                    result = self._create_in_browser(self._worker_page(), snapshot)
+                    if not result.get('project_id'):
+                        # Don't carry a half-filled form or dialog into the next contact
+                        self._discard_page()
+                except Exception as e:
+                    logger.error(f"Playwright initialization error: {e}")
+                    self._discard_page()
+                    result = {'project_id': None, 'error': str(e)}
+                logger.info(f"Contact {snapshot.id} finished in {time.monotonic() - started:.1f}s")
+                results.put((snapshot, started_at, result))
+        finally:
+            self._close_browser()
+
+
+class ProjectCreatorPool:
+    """
+    Bounded pool of warm AlbiwareProjectCreator instances
+    
+    Callers borrow a creator with ``with pool.acquire() as creator:`` instead
+    of constructing their own, so the number of Chromium processes is capped
+    at max_size * max_workers no matter how many jobs or admin requests run
+    at once. Pooled creators stay entered, keeping their browsers and login
+    warm between batches; one that raises is closed and replaced lazily.
+    """
+    
+    def __init__(
+        self,
+        factory: Callable[[], AlbiwareProjectCreator],
+        min_size: int = 0,
+        max_size: int = 1,
+        acquire_timeout: float = 600.0
+    ):
+        """
+        Initialize the pool
+        
+        Args:
+            factory: Builds a new (not yet started) creator
+            min_size: Creators to build up front
+            max_size: Most creators that may exist at once
+            acquire_timeout: Seconds to wait for a free creator before giving up
+        """
+        self._factory = factory
+        self.max_size = max(1, max_size)
+        self.acquire_timeout = acquire_timeout
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._idle: "queue.LifoQueue[AlbiwareProjectCreator]" = queue.LifoQueue()
+        for _ in range(min(min_size, self.max_size)):
+            self._idle.put(self._create())
+        
+        # Pooled browsers outlive any one caller; make sure they go down with the process
+        atexit.register(self.close)
+    
+    @contextmanager
+    def acquire(self) -> Iterator[AlbiwareProjectCreator]:
+        """
+        Borrow a creator for the duration of the block
+        
+        Raises:
+            TimeoutError: If no creator frees up within acquire_timeout
+        """
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"No project creator available after {self.acquire_timeout:.0f}s")
+        
+        try:
+            try:
+                creator = self._idle.get_nowait()
+            except queue.Empty:
+                creator = self._create()
+            
+            try:
+                yield creator
+            except Exception:
+                logger.warning("Discarding project creator after error")
+                self._destroy(creator)
+                raise
+            self._idle.put(creator)
+        finally:
+            self._slots.release()
+    
+    def close(self) -> None:
+        """Close every idle creator and its browsers"""
+        while True:
+            try:
+                creator = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._destroy(creator)
+    
+    def _create(self) -> AlbiwareProjectCreator:
+        """Build a creator and hold it entered so its workers and browsers survive between batches"""
+        creator = self._factory()
+        creator.__enter__()
+        return creator
+    
+    def _destroy(self, creator: AlbiwareProjectCreator) -> None:
+        """Shut a creator's workers down, ignoring errors from a broken browser"""
+        try:
+            creator.__exit__(None, None, None)
+        except Exception as e:
+            logger.warning(f"Error closing project creator: {e}")
@@ -4,7 +4,6 @@ Replaces the navigation and form filling methods in project_creator.py
 """
 
 import logging
-import time
 from datetime import datetime
 from typing import Optional
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeout
@@ -13,14 +12,47 @@ from database.enhanced_models import Contact
 
 logger = logging.getLogger(__name__)
 
+# Albiware project type and referral source for each contact value; anything
+# unmapped falls back to the default
+DEFAULT_PROJECT_TYPE = 'Emergency Mitigation Services (EMS)'
+PROJECT_TYPE_MAP = {
+    'Water Damage': DEFAULT_PROJECT_TYPE,
+    'Fire Damage': DEFAULT_PROJECT_TYPE,
+    'Mold': DEFAULT_PROJECT_TYPE,
+    'Other': DEFAULT_PROJECT_TYPE
+}
+
+DEFAULT_REFERRAL_SOURCE = 'Lead Gen'
+REFERRAL_SOURCE_MAP = {
+    'Google': DEFAULT_REFERRAL_SOURCE,
+    'Yelp': DEFAULT_REFERRAL_SOURCE,
+    'Referral': DEFAULT_REFERRAL_SOURCE,
+    'Other': DEFAULT_REFERRAL_SOURCE
+}
+
+
+# Selects the first <option> whose text contains the label and fires change on
+# its <select>; dispatchEvent reaches jQuery/Select2 handlers as well
+SELECT_OPTION_BY_TEXT_JS = """
+(label) => {
+    const option = [...document.querySelectorAll('select option')].find(o => o.text.includes(label));
+    if (!option) return false;
+    option.selected = true;
+    option.closest('select').dispatchEvent(new Event('change', {bubbles: true}));
+    return true;
+}
+"""
+
 
 def navigate_to_create_project_v2(page: Page) -> bool:
     """Navigate directly to project creation URL"""
     try:
         logger.info("Navigating to project creation...")
         
-        # Direct navigation - much more reliable than clicking through menus
-        page.goto("https://app.albiware.com/Project/New", wait_until="networkidle", timeout=30000)
+        # Direct navigation - much more reliable than clicking through menus.
+        # Kendo and analytics keep XHRs going, so networkidle only adds dead time;
+        # the form selector below is the real readiness signal.
+        page.goto("https://app.albiware.com/Project/New", wait_until="domcontentloaded", timeout=30000)
         
         # Wait for form to be ready
         page.wait_for_selector('#NewProjectForm', timeout=15000)
@@ -45,17 +77,13 @@ def fill_project_form_v2(page: Page, contact: Contact) -> bool:
         def select_kendo_dropdown(page, label_text, value_text, timeout=5000):
             """Select a value from a Kendo UI dropdown"""
             try:
-                # Find the dropdown by nearby label
-                page.locator(f'label:has-text("{label_text}")').scroll_into_view_if_needed()
-                time.sleep(0.3)
-                
-                # Click the dropdown to open it
+                # Click the dropdown (found by nearby label) to open it;
+                # click() scrolls it into view and waits until it is actionable
                 page.locator(f'label:has-text("{label_text}")').locator('..').locator('span[role="listbox"], span[role="combobox"]').first.click()
-                time.sleep(0.5)
                 
-                # Click the desired option
-                page.locator(f'li:has-text("{value_text}")').first.click(timeout=timeout)
-                time.sleep(0.3)
+                # Click the desired option (auto-waits for the list to render it);
+                # filter() takes the text as-is, so quotes in it can't break the selector
+                page.locator('li').filter(has_text=value_text).first.click(timeout=timeout)
                 
                 logger.info(f"Selected {label_text}: {value_text}")
                 return True
@@ -69,26 +97,17 @@ def fill_project_form_v2(page: Page, contact: Contact) -> bool:
             # The customer field is in "Customer Information" section
             # Click on the search input
             customer_input = page.locator('input[role="searchbox"]').first
-            customer_input.click()
             customer_input.fill(contact.full_name)
-            time.sleep(1)
             
-            # Select from dropdown results
-            page.locator(f'li:has-text("{contact.full_name}")').first.click()
-            time.sleep(0.5)
+            # Select from dropdown results; click() waits for the search to return the match
+            page.locator('li').filter(has_text=contact.full_name).first.click(timeout=10000)
             logger.info(f"Selected customer: {contact.full_name}")
         except Exception as e:
             logger.error(f"Failed to select customer: {e}")
             return False
         
         # 2. Project Type
-        project_type_map = {
-            'Water Damage': 'Emergency Mitigation Services (EMS)',
-            'Fire Damage': 'Emergency Mitigation Services (EMS)',
-            'Mold': 'Emergency Mitigation Services (EMS)',
-            'Other': 'Emergency Mitigation Services (EMS)'
-        }
-        albiware_project_type = project_type_map.get(contact.project_type, 'Emergency Mitigation Services (EMS)')
+        albiware_project_type = PROJECT_TYPE_MAP.get(contact.project_type, DEFAULT_PROJECT_TYPE)
         select_kendo_dropdown(page, "Project Type", albiware_project_type)
         
         # 3. Property Type
@@ -103,13 +122,7 @@ def fill_project_form_v2(page: Page, contact: Contact) -> bool:
         select_kendo_dropdown(page, "Insurance Info", insurance_value)
         
         # 6. Referral Source - Map to Albiware values
-        referral_map = {
-            'Google': 'Lead Gen',
-            'Yelp': 'Lead Gen',
-            'Referral': 'Lead Gen',
-            'Other': 'Lead Gen'
-        }
-        albiware_referral = referral_map.get(contact.referral_source, 'Lead Gen')
+        albiware_referral = REFERRAL_SOURCE_MAP.get(contact.referral_source, DEFAULT_REFERRAL_SOURCE)
         select_kendo_dropdown(page, "Referral Source", albiware_referral)
         
         # 7. Assigned Staff - Rodolfo Arceo
@@ -117,9 +130,12 @@ def fill_project_form_v2(page: Page, contact: Contact) -> bool:
         
         # 8. Project Roles - Estimator
         try:
-            # Project roles is a multi-select, need to click the option
-            page.locator('option:has-text("Estimator")').click()
-            logger.info("Selected project role: Estimator")
+            # Project roles is a multi-select; select the option in-page rather
+            # than clicking it, which Playwright can't do reliably for <option>s
+            if page.evaluate(SELECT_OPTION_BY_TEXT_JS, "Estimator"):
+                logger.info("Selected project role: Estimator")
+            else:
+                logger.warning("Estimator role option not found")
         except Exception as e:
             logger.warning(f"Could not select Estimator role: {e}")
         
@@ -0,0 +1,83 @@
+"""
+Rate Limiter Utility
+Thread-safe token bucket that backs off when the server starts throttling
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket with AIMD rate control
+    
+    Callers only block once the bucket is empty. penalize() halves the refill
+    rate (e.g. on HTTP 429), at most once per cooldown so a burst of 429s from
+    one throttled page load counts as a single signal; every successful
+    acquire() adds a little back until the configured rate is reached again.
+    """
+    
+    def __init__(
+        self,
+        rate: float = 1.0,
+        capacity: int = 5,
+        min_rate: float = 0.05,
+        increase: float = 0.05,
+        cooldown: float = 10.0
+    ):
+        """
+        Initialize the bucket
+        
+        Args:
+            rate: Tokens added per second when not throttled
+            capacity: Maximum burst size
+            min_rate: Floor for the refill rate after repeated penalties
+            increase: Rate added back per successful acquire
+            cooldown: Seconds after a penalty during which further penalties are ignored
+            
+        Raises:
+            ValueError: If rate or min_rate is not positive (acquire() divides by the rate)
+        """
+        if rate <= 0 or min_rate <= 0:
+            raise ValueError(f"TokenBucket rates must be positive (rate={rate}, min_rate={min_rate})")
+        
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.increase = increase
+        self.cooldown = cooldown
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._last_penalty = None
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping only if none are available"""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.rate = min(self.max_rate, self.rate + self.increase)
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+    
+    def penalize(self) -> None:
+        """Server is throttling: halve the refill rate and drain the burst"""
+        with self._lock:
+            now = time.monotonic()
+            if self._last_penalty is not None and now - self._last_penalty < self.cooldown:
+                return
+            self._last_penalty = now
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+            logger.warning(f"Rate limited by server, slowing to {self.rate:.2f} req/s")